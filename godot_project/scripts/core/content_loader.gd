@@ -4,8 +4,21 @@ extends Node
 
 signal content_reloaded(content_type: String)
 
+const SPATIAL_INDEX_PATH := "res://resources/generated/spatial"
+const STRING_TABLE_PATH := "res://resources/generated/strings.json"
+const STRING_REF_PREFIX := "@str_"
+const MANIFEST_PATH := "res://resources/generated/manifest.json"
+const DELTA_PATH := "res://resources/generated/delta.json"
+
 var _content_cache: Dictionary = {}
 var _content_base_path: String = ""
+## string_id -> text, shared by every "@str_<id>" reference in built content
+var _strings: Dictionary = {}
+## Build generation of the content currently in _content_cache
+var _generation: int = 0
+## level_id -> Array of {id, type, position} laid out as an implicit k-d tree
+## (built by tools/spatial_index.py)
+var _spatial_index: Dictionary = {}
 
 
 func _ready() -> void:
@@ -23,11 +36,14 @@ func _ready() -> void:
 
 
 func _load_all_content() -> void:
+	_load_string_table()
 	_load_directory("zones")
 	_load_directory("levels")
 	_load_directory("tasks")
 	_load_directory("reference_pages")
 	_load_directory("dialogues")
+	_load_spatial_indexes()
+	_generation = _read_generation()
 
 
 func _load_directory(subdir: String) -> void:
@@ -45,7 +61,7 @@ func _load_directory(subdir: String) -> void:
 	while file_name != "":
 		if file_name.ends_with(".json"):
 			var file_path = dir_path.path_join(file_name)
-			var data = _load_json_file(file_path)
+			var data = _resolve_strings(_load_json_file(file_path))
 			if data != null:
 				# Handle arrays (task banks) and objects
 				if data is Array:
@@ -61,6 +77,58 @@ func _load_directory(subdir: String) -> void:
 	dir.list_dir_end()
 
 
+func _load_string_table() -> void:
+	_strings.clear()
+	if not FileAccess.file_exists(STRING_TABLE_PATH):
+		return
+	var data = _load_json_file(STRING_TABLE_PATH)
+	if data is Dictionary:
+		_strings = data.get("strings", {})
+
+
+## Replaces string references with their text. Every copy shares the
+## table's String, so repeated text is held in memory once.
+func _resolve_strings(value: Variant) -> Variant:
+	if value is String:
+		if value.begins_with(STRING_REF_PREFIX):
+			var sid: String = value.substr(1)
+			if sid in _strings:
+				return _strings[sid]
+			push_warning("ContentLoader: Unknown string reference %s" % value)
+		return value
+	if value is Dictionary:
+		for key in value:
+			value[key] = _resolve_strings(value[key])
+	elif value is Array:
+		for i in range(value.size()):
+			value[i] = _resolve_strings(value[i])
+	return value
+
+
+func _load_spatial_indexes() -> void:
+	_spatial_index.clear()
+	var dir = DirAccess.open(SPATIAL_INDEX_PATH)
+	if not dir:
+		return
+
+	dir.list_dir_begin()
+	var file_name = dir.get_next()
+	while file_name != "":
+		if file_name.ends_with(".json"):
+			var data = _load_json_file(SPATIAL_INDEX_PATH.path_join(file_name))
+			if data is Dictionary and data.get("format", "") == "kdtree_2d":
+				_spatial_index[data.get("level_id", "")] = data.get("nodes", [])
+		file_name = dir.get_next()
+	dir.list_dir_end()
+
+
+func _read_generation() -> int:
+	if not FileAccess.file_exists(MANIFEST_PATH):
+		return 0
+	var manifest = _load_json_file(MANIFEST_PATH)
+	return int(manifest.get("generation", 0)) if manifest is Dictionary else 0
+
+
 func _get_id_key(subdir: String) -> String:
 	match subdir:
 		"zones": return "zone_id"
@@ -152,6 +220,67 @@ func get_tasks_for_level(level_id: String) -> Array:
 	return result
 
 
+# --- Spatial Queries ---
+# Node at (lo + hi) / 2 is the root of range [lo, hi), split on axis depth % 2.
+
+## Returns the interactable placement closest to pos, or {} if the level has none.
+func get_nearest_interactable(level_id: String, pos: Vector2) -> Dictionary:
+	var tree: Array = _spatial_index.get(level_id, [])
+	var best := {"node": {}, "dist_sq": INF}
+	_kd_nearest(tree, 0, tree.size(), 0, pos, best)
+	return best["node"]
+
+
+## Returns all interactable placements within radius of pos.
+func get_interactables_in_radius(level_id: String, pos: Vector2, radius: float) -> Array:
+	var tree: Array = _spatial_index.get(level_id, [])
+	var found: Array = []
+	_kd_radius(tree, 0, tree.size(), 0, pos, radius, found)
+	return found
+
+
+func _kd_nearest(tree: Array, lo: int, hi: int, depth: int, pos: Vector2, best: Dictionary) -> void:
+	if lo >= hi:
+		return
+	var mid: int = (lo + hi) / 2
+	var node: Dictionary = tree[mid]
+	var node_pos := Vector2(node["position"][0], node["position"][1])
+	var dist_sq := pos.distance_squared_to(node_pos)
+	if dist_sq < best["dist_sq"]:
+		best["node"] = node
+		best["dist_sq"] = dist_sq
+	var axis := depth % 2
+	var delta: float = pos[axis] - node_pos[axis]
+	if delta < 0:
+		_kd_nearest(tree, lo, mid, depth + 1, pos, best)
+		if delta * delta < best["dist_sq"]:
+			_kd_nearest(tree, mid + 1, hi, depth + 1, pos, best)
+	else:
+		_kd_nearest(tree, mid + 1, hi, depth + 1, pos, best)
+		if delta * delta < best["dist_sq"]:
+			_kd_nearest(tree, lo, mid, depth + 1, pos, best)
+
+
+func _kd_radius(tree: Array, lo: int, hi: int, depth: int, pos: Vector2, radius: float, found: Array) -> void:
+	if lo >= hi:
+		return
+	var mid: int = (lo + hi) / 2
+	var node: Dictionary = tree[mid]
+	var node_pos := Vector2(node["position"][0], node["position"][1])
+	if pos.distance_squared_to(node_pos) <= radius * radius:
+		found.append(node)
+	var delta: float = pos[depth % 2] - node_pos[depth % 2]
+	if delta <= radius:
+		_kd_radius(tree, lo, mid, depth + 1, pos, radius, found)
+	if delta >= -radius:
+		_kd_radius(tree, mid + 1, hi, depth + 1, pos, radius, found)
+
+
+## Returns the text for a string table ID, or "" if unknown.
+func get_string(string_id: String) -> String:
+	return _strings.get(string_id, "")
+
+
 ## Hot reload support — call from editor plugin or dev tools
 func reload_content(subdir: String = "") -> void:
 	if subdir.is_empty():
@@ -159,7 +288,56 @@ func reload_content(subdir: String = "") -> void:
 		_load_all_content()
 		content_reloaded.emit("all")
 	else:
+		_load_string_table()
 		_content_cache[subdir] = {}
 		_load_directory(subdir)
+		if subdir == "levels":
+			_load_spatial_indexes()
 		content_reloaded.emit(subdir)
 	print("ContentLoader: Content reloaded (%s)" % (subdir if subdir else "all"))
+
+
+## Targeted hot reload — patches only the records listed in the build's
+## delta.json. Falls back to a full reload if a generation was missed.
+func apply_delta() -> void:
+	var delta = _load_json_file(DELTA_PATH) if FileAccess.file_exists(DELTA_PATH) else null
+	if not delta is Dictionary:
+		return
+
+	var generation: int = int(delta.get("generation", 0))
+	if generation <= _generation:
+		return
+	if int(delta.get("previous_generation", -1)) != _generation:
+		reload_content()
+		return
+
+	_load_string_table()
+	var changes: Dictionary = delta.get("changes", {})
+	for subdir in changes:
+		var change: Dictionary = changes[subdir]
+		var id_key = _get_id_key(subdir)
+		if not id_key:
+			continue
+		if subdir not in _content_cache:
+			_content_cache[subdir] = {}
+		var cache: Dictionary = _content_cache[subdir]
+
+		for removed_id in change.get("removed", []):
+			cache.erase(removed_id)
+
+		var wanted: Dictionary = {}
+		for changed_id in change.get("added", []) + change.get("modified", []):
+			wanted[changed_id] = true
+		for file_name in change.get("files", []):
+			var data = _resolve_strings(_load_json_file(_content_base_path.path_join(subdir).path_join(file_name)))
+			var items: Array = data if data is Array else [data]
+			for item in items:
+				if item is Dictionary and item.get(id_key, "") in wanted:
+					cache[item[id_key]] = item
+
+		if subdir == "levels":
+			_load_spatial_indexes()
+		content_reloaded.emit(subdir)
+
+	_generation = generation
+	print("ContentLoader: Applied delta (generation %d)" % generation)
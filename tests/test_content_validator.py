@@ -11,7 +11,8 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent / "tools"))
 from content_validator import (
     validate_file, ValidationResult, lint_level, lint_task,
-    check_region_connectivity, load_json
+    lint_interactable_placement, check_region_connectivity, load_json,
+    ProjectFileIndex, collect_asset_refs, lint_assets, check_asset_references
 )
 
 CONTENT_DIR = Path(__file__).parent.parent / "content"
@@ -119,6 +120,160 @@ def test_task_short_explanation_fails():
     print("PASS: test_task_short_explanation_fails")
 
 
+def test_overlapping_interactables_fail():
+    """Interactables placed on top of each other should fail lint."""
+    result = ValidationResult()
+    data = {
+        "level_id": "level_test",
+        "interactables": [
+            {"type": "fruit_tree", "id": "ft_1", "position": [200, 400]},
+            {"type": "berry_bush", "id": "bb_1", "position": [210, 405]},
+            {"type": "sign", "id": "sign_1", "position": [600, 400]},
+        ],
+    }
+    lint_interactable_placement(data, result)
+    assert any("'bb_1' and 'ft_1' overlap" in e for e in result.errors), result.summary()
+    assert len(result.errors) == 1
+    print("PASS: test_overlapping_interactables_fail")
+
+
+def test_duplicate_interactable_ids_fail():
+    """Same-id interactables are still overlap-checked and reported as duplicates."""
+    result = ValidationResult()
+    data = {
+        "level_id": "level_test",
+        "interactables": [
+            {"type": "sign", "id": "a", "position": [100, 100]},
+            {"type": "sign", "id": "a", "position": [101, 100]},
+            {"type": "sign", "id": 7, "position": [400, 100]},
+            {"type": "sign", "id": "7", "position": [800, 100]},
+        ],
+    }
+    lint_interactable_placement(data, result)
+    assert any("'a' and 'a' overlap" in e for e in result.errors), result.summary()
+    assert any("Duplicate interactable id 'a'" in e for e in result.errors), result.summary()
+    assert any("Duplicate interactable id '7'" in e for e in result.errors), result.summary()
+    assert len(result.errors) == 3, result.summary()
+    print("PASS: test_duplicate_interactable_ids_fail")
+
+
+def test_out_of_bounds_and_buried_interactables_fail():
+    """Placements outside the region or below the ground should fail lint."""
+    result = ValidationResult()
+    data = {
+        "level_id": "level_test",
+        "interactables": [
+            {"type": "sign", "id": "sign_1", "position": [2000, 300]},
+            {"type": "sign", "id": "sign_2", "position": [300, 550]},
+        ],
+    }
+    lint_interactable_placement(data, result)
+    assert any("'sign_1'" in e and "outside region bounds" in e for e in result.errors)
+    assert any("'sign_2'" in e and "unreachable" in e for e in result.errors)
+    print("PASS: test_out_of_bounds_and_buried_interactables_fail")
+
+
+def test_crowded_interactables_warn():
+    """A tight cluster of interactables should produce a warning."""
+    result = ValidationResult()
+    data = {
+        "level_id": "level_test",
+        "interactables": [
+            {"type": "sign", "id": f"sign_{i}", "position": [300 + 40 * (i % 3), 300 + 40 * (i // 3)]}
+            for i in range(6)
+        ],
+    }
+    lint_interactable_placement(data, result)
+    assert result.ok, result.summary()
+    assert any("crowded" in w for w in result.warnings)
+    print("PASS: test_crowded_interactables_warn")
+
+
+def _make_project(root: Path, files: list[str]):
+    for rel in files:
+        path = root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("")
+
+
+def test_asset_references_resolve_against_index():
+    """Level and task asset references should resolve by path or by stem."""
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        _make_project(root, [
+            "assets/tilesets/zone_1_ground.tres",
+            "assets/sprites/environments/sky_dawn.png",
+            "assets/sprites/environments/sky_dawn.png.import",
+            "assets/sprites/effects/pollen.tscn",
+            "scenes/puzzles/visuals/butterfly_scatter.tscn",
+            ".godot/imported/sky_dawn.png-abc.ctex",
+        ])
+        index = ProjectFileIndex(root)
+        assert "assets/sprites/environments/sky_dawn.png.import" not in index.paths
+        assert not any(p.startswith(".godot") for p in index.paths)
+
+        level = {
+            "level_id": "level_test",
+            "environment": {
+                "tilemap": "res://assets/tilesets/zone_1_ground.tres",
+                "parallax_layers": ["sky_dawn", "far_trees_green"],
+                "particles": ["pollen"],
+            },
+        }
+        result = ValidationResult()
+        used = lint_assets(level, "levels", index, result)
+        assert not result.errors
+        assert len(result.warnings) == 1 and "far_trees_green" in result.warnings[0], result.summary()
+        assert "assets/sprites/environments/sky_dawn.png" in used
+
+        result = ValidationResult()
+        lint_assets([{"task_id": "task_a", "visual": {"type": "butterfly_scatter"}},
+                     {"task_id": "task_b", "visual": {"type": "pollen"}}], "tasks", index, result)
+        # "pollen" exists, but as a particle effect rather than a task visual
+        assert len(result.warnings) == 1 and "task_b" in result.warnings[0], result.summary()
+    print("PASS: test_asset_references_resolve_against_index")
+
+
+def test_null_asset_fields_ignored():
+    """Null environment or visual fields should be skipped, not crash the asset check."""
+    assert collect_asset_refs({"level_id": "level_test", "environment": None}, "levels") == []
+    assert collect_asset_refs({"level_id": "level_test", "environment": {"parallax_layers": None}}, "levels") == []
+    assert collect_asset_refs([{"task_id": "task_a", "visual": None}], "tasks") == []
+    print("PASS: test_null_asset_fields_ignored")
+
+
+def test_unused_assets_reported():
+    """Assets under reference directories that nothing uses should be warned about."""
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        _make_project(root, [
+            "assets/sprites/environments/sky_dawn.png",
+            "assets/sprites/environments/never_used.png",
+        ])
+        result = ValidationResult()
+        check_asset_references(result, ProjectFileIndex(root))
+        assert any("never_used.png" in w for w in result.warnings)
+        assert not any("sky_dawn.png" in w for w in result.warnings)
+    print("PASS: test_unused_assets_reported")
+
+
+def test_project_index_detects_changes():
+    """A long-lived index should notice added files so watch mode can rescan."""
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        _make_project(root, ["assets/sprites/effects/pollen.tscn"])
+        index = ProjectFileIndex(root)
+        assert not index.is_stale()
+        effects = root / "assets" / "sprites" / "effects"
+        (effects / "mist.tscn").write_text("")
+        os.utime(effects, (0, 0))
+        assert index.is_stale()
+        index.refresh()
+        assert index.find_stem("mist", "assets/sprites/effects") == "assets/sprites/effects/mist.tscn"
+        assert not index.is_stale()
+    print("PASS: test_project_index_detects_changes")
+
+
 def test_region_connectivity():
     """All MVP regions should be reachable from level_01."""
     result = ValidationResult()
@@ -152,6 +307,14 @@ if __name__ == "__main__":
         test_level_missing_traversal_fails,
         test_task_missing_answer_fails,
         test_task_short_explanation_fails,
+        test_overlapping_interactables_fail,
+        test_duplicate_interactable_ids_fail,
+        test_out_of_bounds_and_buried_interactables_fail,
+        test_crowded_interactables_warn,
+        test_asset_references_resolve_against_index,
+        test_null_asset_fields_ignored,
+        test_unused_assets_reported,
+        test_project_index_detects_changes,
         test_region_connectivity,
         test_invalid_json_reports_error,
     ]
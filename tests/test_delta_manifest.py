@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""Tests for build delta manifests."""
+
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+# Add tools to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "tools"))
+import json_backend
+from delta_manifest import diff_hashes, hash_record, record_hashes, write_build_manifest
+
+
+def _write(path: Path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data))
+
+
+def _bank(*task_ids: str, difficulty: int = 1) -> list[dict]:
+    return [{"task_id": tid, "difficulty": difficulty, "prompt": f"@str_{tid}"} for tid in task_ids]
+
+
+def test_hash_ignores_key_order():
+    """Record hashes should not depend on key order."""
+    assert hash_record({"a": 1, "b": [1, 2]}) == hash_record({"b": [1, 2], "a": 1})
+    assert hash_record({"a": 1}) != hash_record({"a": 2})
+    print("PASS: test_hash_ignores_key_order")
+
+
+def test_hash_independent_of_backend():
+    """Record hashes should not change with the active JSON backend."""
+    record = {"task_id": "task_a", "weight": 1e16, "scale": 1e-05, "text": "Café"}
+    original = json_backend.backend
+    try:
+        hashes = set()
+        for backend in json_backend.available_backends():
+            json_backend.backend = backend
+            hashes.add(hash_record(record))
+    finally:
+        json_backend.backend = original
+    assert len(hashes) == 1
+    print("PASS: test_hash_independent_of_backend")
+
+
+def test_records_hashed_inside_task_banks():
+    """Each task in a bank should get its own hash entry."""
+    with tempfile.TemporaryDirectory() as tmp:
+        out = Path(tmp)
+        _write(out / "tasks" / "level_01_tasks.json", _bank("task_a", "task_b"))
+        _write(out / "levels" / "level_01.json", {"level_id": "level_01"})
+        hashes = record_hashes(out)
+        assert set(hashes["tasks"]) == {"task_a", "task_b"}
+        assert hashes["tasks"]["task_a"]["file"] == "level_01_tasks.json"
+        assert set(hashes["levels"]) == {"level_01"}
+    print("PASS: test_records_hashed_inside_task_banks")
+
+
+def test_delta_lists_only_changed_records():
+    """Editing one task in a bank should mark only that task as modified."""
+    with tempfile.TemporaryDirectory() as tmp:
+        out = Path(tmp)
+        bank_path = out / "tasks" / "level_01_tasks.json"
+        _write(bank_path, _bank("task_a", "task_b", "task_c"))
+        first = write_build_manifest(out)
+        assert first["generation"] == 1
+        assert first["changes"]["tasks"]["added"] == ["task_a", "task_b", "task_c"]
+
+        bank = _bank("task_a", "task_b", "task_d")
+        bank[0]["difficulty"] = 3
+        _write(bank_path, bank)
+        second = write_build_manifest(out)
+        assert second["generation"] == 2
+        assert second["previous_generation"] == 1
+        change = second["changes"]["tasks"]
+        assert change["added"] == ["task_d"]
+        assert change["modified"] == ["task_a"]
+        assert change["removed"] == ["task_c"]
+        assert change["files"] == ["level_01_tasks.json"]
+
+        third = write_build_manifest(out)
+        assert third["generation"] == 3
+        assert third["changes"] == {}
+        assert json.loads((out / "delta.json").read_text()) == third
+    print("PASS: test_delta_lists_only_changed_records")
+
+
+def test_diff_between_two_outputs():
+    """diff_hashes should compare two independent build outputs."""
+    with tempfile.TemporaryDirectory() as old_tmp, tempfile.TemporaryDirectory() as new_tmp:
+        _write(Path(old_tmp) / "zones" / "zone_1.json", {"zone_id": "zone_1", "levels": ["level_01"]})
+        _write(Path(new_tmp) / "zones" / "zone_1.json", {"zone_id": "zone_1", "levels": ["level_01", "level_02"]})
+        changes = diff_hashes(record_hashes(Path(old_tmp)), record_hashes(Path(new_tmp)))
+        assert changes == {"zones": {"added": [], "modified": ["zone_1"], "removed": [], "files": ["zone_1.json"]}}
+    print("PASS: test_diff_between_two_outputs")
+
+
+if __name__ == "__main__":
+    tests = [
+        test_hash_ignores_key_order,
+        test_hash_independent_of_backend,
+        test_records_hashed_inside_task_banks,
+        test_delta_lists_only_changed_records,
+        test_diff_between_two_outputs,
+    ]
+
+    passed = 0
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except Exception as e:
+            print(f"FAIL: {test.__name__}: {e}")
+            failed += 1
+
+    print(f"\n{'='*40}")
+    print(f"Results: {passed} passed, {failed} failed, {len(tests)} total")
+    if failed > 0:
+        sys.exit(1)
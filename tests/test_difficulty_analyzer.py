@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""Tests for the difficulty-curve and quest-balance analyzer."""
+
+import gc
+import json
+import sys
+import tempfile
+import time
+from collections import Counter
+from pathlib import Path
+
+# Add tools to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "tools"))
+from difficulty_analyzer import HAS_NUMPY, analyze, build_columns, load_curriculum, synthetic_curriculum
+from content_validator import ValidationResult
+
+
+def _task(task_id: str, difficulty: int, hints: int = 2, skill: str = "count_objects") -> dict:
+    return {
+        "task_id": task_id,
+        "difficulty": difficulty,
+        "hints": [{"level": i + 1, "text": "hint"} for i in range(hints)],
+        "skill_tags": [skill],
+    }
+
+
+def _level(level_id: str, zone_id: str, prefix: str) -> dict:
+    return {
+        "level_id": level_id,
+        "zone_id": zone_id,
+        "quest_line": {
+            "warmup": f"{prefix}_w",
+            "teach": [f"{prefix}_t"],
+            "practice": [f"{prefix}_p1", f"{prefix}_p2"],
+            "apply": [f"{prefix}_a"],
+            "boss": f"{prefix}_b",
+        },
+    }
+
+
+def _curve(prefix: str, w: int, t: int, p1: int, p2: int, a: int, b: int) -> list[dict]:
+    return [_task(f"{prefix}_w", w), _task(f"{prefix}_t", t), _task(f"{prefix}_p1", p1),
+            _task(f"{prefix}_p2", p2), _task(f"{prefix}_a", a), _task(f"{prefix}_b", b)]
+
+
+def test_smooth_curve_has_no_findings():
+    """A steadily rising quest line should produce no findings."""
+    if not HAS_NUMPY:
+        print("SKIP: test_smooth_curve_has_no_findings (numpy not installed)")
+        return
+    cols = build_columns([_level("level_01", "zone_1", "a")], _curve("a", 1, 1, 2, 2, 3, 3))
+    report = analyze(cols)
+    assert report["findings"] == [], report["findings"]
+    assert report["levels"]["level_01"]["stage_curve"] == {
+        "warmup": 1.0, "teach": 1.0, "practice": 2.0, "apply": 3.0, "boss": 3.0,
+    }
+    print("PASS: test_smooth_curve_has_no_findings")
+
+
+def test_spikes_drops_and_weak_boss_flagged():
+    """Stage spikes, stage drops, task jumps and an easy boss should all be reported."""
+    if not HAS_NUMPY:
+        print("SKIP: test_spikes_drops_and_weak_boss_flagged (numpy not installed)")
+        return
+    cols = build_columns([_level("level_01", "zone_1", "a")], _curve("a", 1, 1, 4, 5, 3, 2))
+    findings = analyze(cols)["findings"]
+    assert any("spike teach -> practice" in f for f in findings), findings
+    assert any("drops practice -> apply" in f for f in findings), findings
+    assert any("a_t (1) -> a_p1 (4) jumps +3" in f for f in findings), findings
+    assert any("boss (2.00) is easier" in f for f in findings), findings
+    print("PASS: test_spikes_drops_and_weak_boss_flagged")
+
+
+def test_zone_curve_and_missing_refs():
+    """Level-to-level jumps within a zone and dangling quest refs should be reported."""
+    if not HAS_NUMPY:
+        print("SKIP: test_zone_curve_and_missing_refs (numpy not installed)")
+        return
+    levels = [_level("level_01", "zone_1", "a"), _level("level_02", "zone_1", "b"),
+              _level("level_03", "zone_2", "c")]
+    tasks = _curve("a", 1, 1, 1, 1, 1, 1) + _curve("b", 4, 4, 4, 4, 4, 4) + _curve("c", 1, 1, 1, 1, 1, 1)
+    tasks = [t for t in tasks if t["task_id"] != "c_a"]
+    report = analyze(build_columns(levels, tasks))
+    findings = report["findings"]
+    assert any("zone_1: level_01 -> level_02 mean difficulty jumps +3.00" in f for f in findings), findings
+    # level_02 -> level_03 crosses a zone boundary and is not compared
+    assert not any("level_02 -> level_03" in f for f in findings), findings
+    assert any("level_03: quest_line references 'c_a'" in f for f in findings), findings
+    assert report["zones"]["zone_1"]["level_curve"] == [1.0, 4.0]
+    print("PASS: test_zone_curve_and_missing_refs")
+
+
+def test_hint_bands_and_skill_imbalance():
+    """Harder bands with fewer hints and under-covered skill tags should be reported."""
+    if not HAS_NUMPY:
+        print("SKIP: test_hint_bands_and_skill_imbalance (numpy not installed)")
+        return
+    tasks = [_task(f"e{i}", 1, hints=3, skill="common") for i in range(8)]
+    tasks += [_task(f"h{i}", 3, hints=1, skill="common") for i in range(8)]
+    tasks += [_task("rare", 2, hints=3, skill="rare_skill")]
+    report = analyze(build_columns([], tasks))
+    assert report["hint_bands"]["3"]["mean_hints"] == 1.0
+    assert any("Difficulty 3 tasks average fewer hints" in f for f in report["findings"]), report["findings"]
+    assert any("'rare_skill' has 1 tasks" in f for f in report["findings"]), report["findings"]
+    print("PASS: test_hint_bands_and_skill_imbalance")
+
+
+def test_every_skill_tag_counted():
+    """Tasks with several skill tags should count toward each of them."""
+    if not HAS_NUMPY:
+        print("SKIP: test_every_skill_tag_counted (numpy not installed)")
+        return
+    tasks = [_task("a", 1), _task("b", 3), _task("c", 5)]
+    tasks[0]["skill_tags"] = ["count_objects", "ordering"]
+    tasks[1]["skill_tags"] = ["ordering"]
+    tasks[2]["skill_tags"] = []
+    tags = analyze(build_columns([], tasks))["skills"]["tags"]
+    assert tags == {
+        "count_objects": {"tasks": 1, "mean_difficulty": 1.0},
+        "ordering": {"tasks": 2, "mean_difficulty": 2.0},
+    }, tags
+
+    # Shipped content: same per-tag counts as the validator's coverage check
+    expected: Counter = Counter()
+    for f in sorted((Path(__file__).parent.parent / "content" / "tasks").glob("*.json")):
+        for task in json.loads(f.read_text(encoding="utf-8")):
+            expected.update(task.get("skill_tags", []))
+    tags = analyze(load_curriculum())["skills"]["tags"]
+    assert {tag: data["tasks"] for tag, data in tags.items()} == dict(expected)
+    print("PASS: test_every_skill_tag_counted")
+
+
+def test_malformed_files_skipped():
+    """A broken level or task file should be skipped rather than abort the analysis."""
+    if not HAS_NUMPY:
+        print("SKIP: test_malformed_files_skipped (numpy not installed)")
+        return
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        (root / "levels").mkdir()
+        (root / "tasks").mkdir()
+        (root / "levels" / "level_01_a.json").write_text(json.dumps(_level("level_01", "zone_1", "a")))
+        (root / "levels" / "level_02_b.json").write_text("{broken")
+        (root / "tasks" / "level_01_tasks.json").write_text(json.dumps(_curve("a", 1, 1, 2, 2, 3, 3)))
+        (root / "tasks" / "level_02_tasks.json").write_text("[{")
+        cols = load_curriculum(root)
+        assert cols.level_ids == ["level_01"]
+        assert len(cols) == 6
+    print("PASS: test_malformed_files_skipped")
+
+
+def test_shipped_content_analyzes():
+    """The shipped curriculum should load into columns and analyze cleanly."""
+    if not HAS_NUMPY:
+        print("SKIP: test_shipped_content_analyzes (numpy not installed)")
+        return
+    cols = load_curriculum()
+    report = analyze(cols)
+    assert report["tasks"] == len(cols) > 0
+    assert set(report["levels"]) == {"level_01", "level_02", "level_03"}
+    assert not any("spike" in f or "easier" in f for f in report["findings"]), report["findings"]
+    print("PASS: test_shipped_content_analyzes")
+
+
+def test_synthetic_100k_scales_linearly():
+    """Analysis time should grow roughly linearly from 20k to 100k tasks."""
+    if not HAS_NUMPY:
+        print("SKIP: test_synthetic_100k_scales_linearly (numpy not installed)")
+        return
+
+    def _best_time(n_tasks: int) -> tuple[float, dict]:
+        levels, tasks = synthetic_curriculum(n_tasks)
+        best, report = float("inf"), {}
+        # Like timeit: GC passes scale with the whole heap, not the work timed
+        gc.disable()
+        try:
+            for _ in range(5):
+                start = time.perf_counter()
+                report = analyze(build_columns(levels, tasks))
+                best = min(best, time.perf_counter() - start)
+        finally:
+            gc.enable()
+        return best, report
+
+    small, _ = _best_time(20_000)
+    large, report = _best_time(100_000)
+    assert report["tasks"] == 100_000
+    assert report["placed_tasks"] == 100_000
+    assert len(report["levels"]) == 2_500
+    # 5x the tasks; 2x headroom over linear still catches quadratic (25x)
+    assert large <= small * 10, f"20k: {small:.3f}s, 100k: {large:.3f}s"
+    print(f"PASS: test_synthetic_100k_scales_linearly ({small:.2f}s -> {large:.2f}s)")
+
+
+def test_validator_hook_reports_warnings():
+    """check_difficulty_curve should surface findings as validator warnings."""
+    from difficulty_analyzer import check_difficulty_curve
+    result = ValidationResult()
+    check_difficulty_curve(result)
+    assert result.ok
+    if HAS_NUMPY:
+        assert any("Analyzed" in i for i in result.info)
+    print("PASS: test_validator_hook_reports_warnings")
+
+
+if __name__ == "__main__":
+    tests = [
+        test_smooth_curve_has_no_findings,
+        test_spikes_drops_and_weak_boss_flagged,
+        test_zone_curve_and_missing_refs,
+        test_hint_bands_and_skill_imbalance,
+        test_every_skill_tag_counted,
+        test_malformed_files_skipped,
+        test_shipped_content_analyzes,
+        test_synthetic_100k_scales_linearly,
+        test_validator_hook_reports_warnings,
+    ]
+
+    passed = 0
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except Exception as e:
+            print(f"FAIL: {test.__name__}: {e}")
+            failed += 1
+
+    print(f"\n{'='*40}")
+    print(f"Results: {passed} passed, {failed} failed, {len(tests)} total")
+    if failed > 0:
+        sys.exit(1)
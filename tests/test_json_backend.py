@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""Tests for the pluggable JSON backend."""
+
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+# Add tools to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "tools"))
+from json_backend import (
+    HAS_ORJSON, JSONDecodeError, StdlibBackend, _has_nonportable_float, available_backends,
+    read_json, write_json,
+)
+
+CONTENT_DIR = Path(__file__).parent.parent / "content"
+
+
+def _content_files() -> list[Path]:
+    return sorted(f for f in CONTENT_DIR.rglob("*.json") if "schemas" not in f.parts)
+
+
+def test_backends_parse_identically():
+    """Every backend should parse shipped content to the same data as stdlib json."""
+    for f in _content_files():
+        expected = json.loads(f.read_text(encoding="utf-8"))
+        for backend in available_backends():
+            assert backend.loads(f.read_bytes()) == expected, f"{backend.name}: {f.name}"
+    print("PASS: test_backends_parse_identically")
+
+
+def test_backends_serialize_identically():
+    """Minified and pretty output should be byte-identical across backends."""
+    for f in _content_files():
+        data = json.loads(f.read_bytes())
+        for pretty in (False, True):
+            for sort_keys in (False, True):
+                outputs = {b.name: b.dumps(data, pretty=pretty, sort_keys=sort_keys) for b in available_backends()}
+                assert len(set(outputs.values())) == 1, f"{f.name}: pretty={pretty} sort_keys={sort_keys}"
+    print("PASS: test_backends_serialize_identically")
+
+
+def test_edge_floats_serialize_identically():
+    """Exponent and non-finite floats should come out the same under every backend."""
+    data = {"small": 1e-05, "large": 1e16, "big": 1.2345678901234568e17, "neg": -0.0,
+            "nan": float("nan"), "inf": [float("inf"), float("-inf")], "plain": 0.1}
+    for pretty in (False, True):
+        outputs = {b.name: b.dumps(data, pretty=pretty) for b in available_backends()}
+        assert len(set(outputs.values())) == 1, outputs
+    assert StdlibBackend().dumps(data["large"]) == b"1e+16"
+    assert StdlibBackend().dumps(data["nan"]) == b"null"
+    print("PASS: test_edge_floats_serialize_identically")
+
+
+def test_nonportable_float_scan():
+    """Only number tokens orjson formats differently should force a stdlib re-encode."""
+    assert _has_nonportable_float(b'{"a":1e16}')
+    assert _has_nonportable_float(b'[0.5,-0.00001]')
+    assert _has_nonportable_float(b'{\n  "a": 1.5e-7\n}')
+    assert not _has_nonportable_float(b'{"color":"#2A5E2A","a":10.00001,"b":0.0001,"c":null}')
+    if HAS_ORJSON:
+        import orjson
+        # Shipped content takes the fast path
+        for f in _content_files():
+            assert not _has_nonportable_float(orjson.dumps(json.loads(f.read_bytes()))), f.name
+    print("PASS: test_nonportable_float_scan")
+
+
+def test_stdlib_output_format():
+    """Minified output has no whitespace; pretty output is 2-space indented UTF-8."""
+    data = {"b": [1, 2], "a": "Café"}
+    assert StdlibBackend().dumps(data) == '{"b":[1,2],"a":"Café"}'.encode("utf-8")
+    assert StdlibBackend().dumps(data, sort_keys=True) == '{"a":"Café","b":[1,2]}'.encode("utf-8")
+    assert StdlibBackend().dumps(data, pretty=True) == json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+    print("PASS: test_stdlib_output_format")
+
+
+def test_invalid_json_raises_decode_error():
+    """Every backend should raise the same JSONDecodeError for broken input."""
+    messages = set()
+    for backend in available_backends():
+        try:
+            backend.loads(b"{invalid json")
+        except JSONDecodeError as e:
+            messages.add(str(e))
+        else:
+            raise AssertionError(f"{backend.name} accepted invalid JSON")
+    assert len(messages) == 1
+    print("PASS: test_invalid_json_raises_decode_error")
+
+
+def test_stdlib_only_values_still_parse():
+    """Input stdlib accepts (e.g. NaN) should parse under every backend."""
+    for backend in available_backends():
+        value = backend.loads(b'{"x": NaN}')["x"]
+        assert value != value
+    print("PASS: test_stdlib_only_values_still_parse")
+
+
+def test_write_read_round_trip():
+    """write_json should add a trailing newline and read back the same data."""
+    data = {"task_id": "task_a", "hints": [{"level": 1, "text": "Count — slowly"}]}
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "out.json"
+        for pretty in (False, True):
+            write_json(path, data, pretty=pretty)
+            assert path.read_bytes().endswith(b"}\n")
+            assert read_json(path) == data
+    print("PASS: test_write_read_round_trip")
+
+
+if __name__ == "__main__":
+    tests = [
+        test_backends_parse_identically,
+        test_backends_serialize_identically,
+        test_edge_floats_serialize_identically,
+        test_nonportable_float_scan,
+        test_stdlib_output_format,
+        test_invalid_json_raises_decode_error,
+        test_stdlib_only_values_still_parse,
+        test_write_read_round_trip,
+    ]
+
+    passed = 0
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except Exception as e:
+            print(f"FAIL: {test.__name__}: {e}")
+            failed += 1
+
+    print(f"\n{'='*40}")
+    print(f"Results: {passed} passed, {failed} failed, {len(tests)} total")
+    if failed > 0:
+        sys.exit(1)
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""Tests for the interactable spatial index."""
+
+import math
+import random
+import sys
+from pathlib import Path
+
+# Add tools to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "tools"))
+from spatial_index import build_kdtree, build_level_index, nearest, within_radius
+from content_validator import load_json
+
+CONTENT_DIR = Path(__file__).parent.parent / "content"
+
+
+def _random_placements(n: int, seed: int = 7) -> list[dict]:
+    rng = random.Random(seed)
+    return [
+        {"type": "fruit_tree", "id": f"it_{i}", "position": [rng.uniform(0, 1200), rng.uniform(0, 480)]}
+        for i in range(n)
+    ]
+
+
+def test_nearest_matches_linear_scan():
+    """k-d tree nearest should agree with a brute-force scan."""
+    items = _random_placements(200)
+    tree = build_kdtree(items)
+    rng = random.Random(11)
+    for _ in range(100):
+        point = (rng.uniform(-50, 1250), rng.uniform(-50, 530))
+        node, dist = nearest(tree, point)
+        expected = min(math.dist(point, i["position"]) for i in items)
+        assert math.isclose(dist, expected), f"{dist} != {expected}"
+        assert math.isclose(math.dist(point, node["position"]), expected)
+    print("PASS: test_nearest_matches_linear_scan")
+
+
+def test_within_radius_matches_linear_scan():
+    """k-d tree radius query should return exactly the brute-force set."""
+    items = _random_placements(200)
+    tree = build_kdtree(items)
+    rng = random.Random(13)
+    for _ in range(100):
+        point = (rng.uniform(0, 1200), rng.uniform(0, 480))
+        radius = rng.uniform(10, 200)
+        got = {n["id"] for n in within_radius(tree, point, radius)}
+        expected = {i["id"] for i in items if math.dist(point, i["position"]) <= radius}
+        assert got == expected
+    print("PASS: test_within_radius_matches_linear_scan")
+
+
+def test_nearest_excludes_id():
+    """exclude_id should skip the query's own node."""
+    tree = build_kdtree([
+        {"type": "sign", "id": "a", "position": [0, 0]},
+        {"type": "sign", "id": "b", "position": [10, 0]},
+    ])
+    node, dist = nearest(tree, (0, 0), exclude_id="a")
+    assert node["id"] == "b" and dist == 10
+    print("PASS: test_nearest_excludes_id")
+
+
+def test_missing_positions_are_skipped():
+    """Placements without a 2-element position are left out of the index."""
+    tree = build_kdtree([{"type": "sign", "id": "a"}, {"type": "sign", "id": "b", "position": [1]}])
+    assert tree == []
+    assert nearest(tree, (0, 0)) == (None, float("inf"))
+    print("PASS: test_missing_positions_are_skipped")
+
+
+def test_level_index_covers_all_interactables():
+    """The emitted index for a shipped level should contain every placement."""
+    level, err = load_json(CONTENT_DIR / "levels" / "level_01_counting.json")
+    assert err is None
+    index = build_level_index(level)
+    assert index["level_id"] == "level_01"
+    assert index["format"] == "kdtree_2d"
+    assert sorted(n["id"] for n in index["nodes"]) == sorted(i["id"] for i in level["interactables"])
+    print("PASS: test_level_index_covers_all_interactables")
+
+
+if __name__ == "__main__":
+    tests = [
+        test_nearest_matches_linear_scan,
+        test_within_radius_matches_linear_scan,
+        test_nearest_excludes_id,
+        test_missing_positions_are_skipped,
+        test_level_index_covers_all_interactables,
+    ]
+
+    passed = 0
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except Exception as e:
+            print(f"FAIL: {test.__name__}: {e}")
+            failed += 1
+
+    print(f"\n{'='*40}")
+    print(f"Results: {passed} passed, {failed} failed, {len(tests)} total")
+    if failed > 0:
+        sys.exit(1)
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""Tests for player-facing string table extraction."""
+
+import copy
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+# Add tools to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "tools"))
+from string_table import (
+    ExtractionStats, collect_stats, extract_strings, resolve_strings,
+    string_id, verify_round_trip, write_string_table,
+)
+from content_validator import load_json
+
+CONTENT_DIR = Path(__file__).parent.parent / "content"
+
+
+def _task(task_id: str, hint: str) -> dict:
+    return {
+        "task_id": task_id,
+        "prompt": "How many mangoes are on the tree?",
+        "hints": [{"level": 1, "text": hint}, {"level": 2, "text": "Try again!"}],
+        "explanation": "Count each mango once.",
+        "answer": 5,
+    }
+
+
+def test_duplicate_strings_share_one_entry():
+    """Identical text across tasks should map to a single table entry."""
+    table: dict[str, str] = {}
+    bank = [_task("task_a", "Start on the left"), _task("task_b", "Start on the right")]
+    extract_strings(bank, "tasks", table)
+    assert bank[0]["prompt"] == bank[1]["prompt"]
+    assert bank[0]["hints"][1]["text"] == bank[1]["hints"][1]["text"] == "@" + string_id("Try again!")
+    # prompt, explanation, "Try again!" and two distinct hints
+    assert len(table) == 5
+    print("PASS: test_duplicate_strings_share_one_entry")
+
+
+def test_non_text_fields_untouched():
+    """IDs and answers must not be moved into the string table."""
+    table: dict[str, str] = {}
+    bank = [_task("task_a", "Start on the left")]
+    extract_strings(bank, "tasks", table)
+    assert bank[0]["task_id"] == "task_a"
+    assert bank[0]["answer"] == 5
+    assert bank[0]["hints"][0]["level"] == 1
+    print("PASS: test_non_text_fields_untouched")
+
+
+def test_shipped_content_round_trips():
+    """Every shipped content file should resolve back to itself."""
+    table: dict[str, str] = {}
+    for content_type in ["zones", "levels", "tasks", "reference_pages"]:
+        for f in sorted((CONTENT_DIR / content_type).glob("*.json")):
+            original, err = load_json(f)
+            assert err is None
+            data = extract_strings(copy.deepcopy(original), content_type, table)
+            assert data != original, f"{f.name}: nothing extracted"
+            assert resolve_strings(data, table) == original, f"{f.name}: round trip failed"
+    print("PASS: test_shipped_content_round_trips")
+
+
+def test_reference_like_text_rejected():
+    """Authored text that looks like a string reference is ambiguous and rejected."""
+    try:
+        extract_strings({"prompt": "@str_abc"}, "tasks", {})
+    except ValueError:
+        print("PASS: test_reference_like_text_rejected")
+        return
+    raise AssertionError("Expected ValueError")
+
+
+def test_stats_count_duplicates():
+    """Stats should report inline vs unique strings."""
+    stats = ExtractionStats()
+    collect_stats([_task("task_a", "Hint one"), _task("task_b", "Hint two")], "tasks", stats)
+    assert stats.total_strings == 8
+    assert len(stats.unique) == 5
+    assert stats.unique_bytes < stats.total_bytes
+    print("PASS: test_stats_count_duplicates")
+
+
+def test_references_independent_of_other_files():
+    """A file's generated references should not depend on what else is built."""
+    bank = [_task("task_a", "Start on the left")]
+    alone = extract_strings(copy.deepcopy(bank), "tasks", {})
+    table: dict[str, str] = {}
+    extract_strings([_task(f"task_{i}", "Start on the left") for i in range(3)], "tasks", table)
+    shared = extract_strings(copy.deepcopy(bank), "tasks", table)
+    assert alone == shared
+    assert all(h["text"].startswith("@str_") for h in alone[0]["hints"])
+    print("PASS: test_references_independent_of_other_files")
+
+
+def test_verify_round_trip_detects_drift():
+    """verify_round_trip should flag generated files that no longer match the source."""
+    with tempfile.TemporaryDirectory() as tmp:
+        content_dir = Path(tmp) / "content"
+        output_dir = Path(tmp) / "generated"
+        (content_dir / "tasks").mkdir(parents=True)
+        (output_dir / "tasks").mkdir(parents=True)
+
+        bank = [_task("task_a", "Start on the left")]
+        (content_dir / "tasks" / "bank.json").write_text(json.dumps(bank))
+        table: dict[str, str] = {}
+        built = extract_strings(copy.deepcopy(bank), "tasks", table)
+        (output_dir / "tasks" / "bank.json").write_text(json.dumps(built))
+        write_string_table(table, output_dir / "strings.json")
+        assert verify_round_trip(content_dir, output_dir) == []
+
+        bank[0]["explanation"] = "Edited after the build."
+        (content_dir / "tasks" / "bank.json").write_text(json.dumps(bank))
+        problems = verify_round_trip(content_dir, output_dir)
+        assert len(problems) == 1 and "differs" in problems[0]
+    print("PASS: test_verify_round_trip_detects_drift")
+
+
+if __name__ == "__main__":
+    tests = [
+        test_duplicate_strings_share_one_entry,
+        test_non_text_fields_untouched,
+        test_shipped_content_round_trips,
+        test_reference_like_text_rejected,
+        test_stats_count_duplicates,
+        test_references_independent_of_other_files,
+        test_verify_round_trip_detects_drift,
+    ]
+
+    passed = 0
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except Exception as e:
+            print(f"FAIL: {test.__name__}: {e}")
+            failed += 1
+
+    print(f"\n{'='*40}")
+    print(f"Results: {passed} passed, {failed} failed, {len(tests)} total")
+    if failed > 0:
+        sys.exit(1)
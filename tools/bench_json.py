@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Whips JSON Backend Benchmark
+Compares the available JSON backends on shipped and synthetic content.
+
+Usage:
+    python bench_json.py                    # shipped content + 10k-task synthetic bank
+    python bench_json.py --tasks 50000      # choose the synthetic bank size
+"""
+
+import copy
+import sys
+import time
+from pathlib import Path
+
+from json_backend import StdlibBackend, available_backends, read_json
+
+CONTENT_DIR = Path(__file__).parent.parent / "content"
+CONTENT_SUBDIRS = ["zones", "levels", "tasks", "reference_pages", "dialogues"]
+DEFAULT_SYNTHETIC_TASKS = 10_000
+REPEATS = 5
+
+
+def shipped_corpus() -> list[bytes]:
+    files = []
+    for subdir in CONTENT_SUBDIRS:
+        src_dir = CONTENT_DIR / subdir
+        if src_dir.exists():
+            files.extend(f.read_bytes() for f in sorted(src_dir.glob("*.json")))
+    return files
+
+
+def synthetic_bank(n: int) -> bytes:
+    """A task bank of n tasks cloned from the shipped banks with unique IDs."""
+    templates = []
+    for f in sorted((CONTENT_DIR / "tasks").glob("*.json")):
+        data = read_json(f)
+        templates.extend(data if isinstance(data, list) else [data])
+
+    bank = []
+    for i in range(n):
+        task = copy.deepcopy(templates[i % len(templates)])
+        task["task_id"] = f"task_synthetic_{i:06d}"
+        task["difficulty"] = 1 + i % 5
+        bank.append(task)
+    return StdlibBackend().dumps(bank)
+
+
+def _best_of(fn) -> float:
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def bench(label: str, corpus: list[bytes]):
+    parsed = [StdlibBackend().loads(b) for b in corpus]
+    size_kb = sum(len(b) for b in corpus) / 1024
+    print(f"\n=== {label} ({len(corpus)} files, {size_kb:.0f} KB) ===\n")
+    print(f"  {'backend':<8} {'parse':>10} {'minified':>10} {'pretty':>10}")
+
+    baseline = None
+    for backend in available_backends():
+        parse = _best_of(lambda: [backend.loads(b) for b in corpus])
+        minified = _best_of(lambda: [backend.dumps(d) for d in parsed])
+        pretty = _best_of(lambda: [backend.dumps(d, pretty=True) for d in parsed])
+        row = (parse, minified, pretty)
+        line = f"  {backend.name:<8} " + " ".join(f"{t * 1000:>8.2f}ms" for t in row)
+        if baseline is None:
+            baseline = row
+        else:
+            line += "   (" + ", ".join(f"{b / t:.1f}x" for b, t in zip(baseline, row)) + " vs json)"
+        print(line)
+
+
+def main():
+    args = sys.argv[1:]
+    n = DEFAULT_SYNTHETIC_TASKS
+    if "--tasks" in args:
+        n = int(args[args.index("--tasks") + 1])
+
+    backends = ", ".join(b.name for b in available_backends())
+    print(f"Backends: {backends}  (best of {REPEATS})")
+    if len(available_backends()) == 1:
+        print("orjson not installed — only the stdlib baseline is measured. Install with: pip install orjson")
+
+    bench("Shipped content", shipped_corpus())
+    bench(f"Synthetic task bank ({n} tasks)", [synthetic_bank(n)])
+
+
+if __name__ == "__main__":
+    main()
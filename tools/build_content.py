@@ -3,6 +3,10 @@
 Whips Content Build Tool
 Compiles JSON content files into Godot-ready resources.
 Copies validated content to the Godot project's resources/generated directory.
+Levels also get a k-d tree spatial index written to resources/generated/spatial/.
+Player-facing text is moved into a deduplicated string table (strings.json).
+Each build bumps the generation in manifest.json and writes delta.json with
+the record IDs that were added, modified or removed since the last build.
 
 Usage:
     python build_content.py                 # build all content
@@ -10,24 +14,37 @@ Usage:
     python build_content.py --watch         # watch mode (hot reload)
 """
 
-import json
-import shutil
 import sys
 import time
 import os
 from pathlib import Path
 
+from content_validator import ProjectFileIndex, ValidationResult, lint_assets, load_json
+from delta_manifest import delta_summary, write_build_manifest
+from json_backend import JSONDecodeError, dumps, loads, read_json, write_json
+from spatial_index import build_level_index
+from string_table import (
+    ExtractionStats, collect_stats, extract_strings, load_string_table,
+    resolve_strings, write_string_table,
+)
+
 CONTENT_DIR = Path(__file__).parent.parent / "content"
 OUTPUT_DIR = Path(__file__).parent.parent / "godot_project" / "resources" / "generated"
 VALIDATOR = Path(__file__).parent / "content_validator.py"
 
 CONTENT_SUBDIRS = ["zones", "levels", "tasks", "reference_pages", "dialogues"]
+SPATIAL_DIR = OUTPUT_DIR / "spatial"
+STRING_TABLE_PATH = OUTPUT_DIR / "strings.json"
 
 
 def build_all() -> int:
     """Build all content files to Godot output."""
     errors = 0
     total = 0
+    table: dict[str, str] = {}
+    stats = ExtractionStats()
+    baseline_bytes = 0
+    out_bytes = 0
 
     for subdir in CONTENT_SUBDIRS:
         src_dir = CONTENT_DIR / subdir
@@ -39,13 +56,26 @@ def build_all() -> int:
 
         for json_file in sorted(src_dir.glob("*.json")):
             total += 1
-            if _build_file(json_file, out_dir):
+            if _build_file(json_file, out_dir, table, stats):
                 print(f"  OK: {json_file.name}")
+                # Baseline: the same file minified with its text left inline
+                baseline_bytes += len(dumps(read_json(json_file))) + 1
+                out_bytes += (out_dir / json_file.name).stat().st_size
             else:
                 print(f"  FAIL: {json_file.name}")
                 errors += 1
 
+    # A full build rewrites the table from scratch, dropping unused strings
+    write_string_table(table, STRING_TABLE_PATH)
+    out_bytes += STRING_TABLE_PATH.stat().st_size
+
     print(f"\nBuilt {total - errors}/{total} files ({errors} errors)")
+    print(stats.summary())
+    growth = out_bytes - baseline_bytes
+    pct = (100.0 * growth / baseline_bytes) if baseline_bytes else 0.0
+    print(f"Content bytes: {baseline_bytes} minified inline -> {out_bytes} generated "
+          f"including string table ({growth:+d} bytes, {pct:+.1f}%)")
+    print(delta_summary(write_build_manifest(OUTPUT_DIR)))
     return errors
 
 
@@ -54,19 +84,61 @@ def build_file(path: Path) -> bool:
     subdir = path.parent.name
     out_dir = OUTPUT_DIR / subdir
     out_dir.mkdir(parents=True, exist_ok=True)
-    return _build_file(path, out_dir)
+    # Single-file builds add to the existing table; IDs are content-derived
+    table = load_string_table(STRING_TABLE_PATH)
+    ok = _build_file(path, out_dir, table)
+    if ok:
+        write_string_table(table, STRING_TABLE_PATH)
+        write_build_manifest(OUTPUT_DIR)
+    return ok
 
 
-def _build_file(src: Path, out_dir: Path) -> bool:
-    """Validate and copy a single content file."""
+def _build_file(src: Path, out_dir: Path, table: dict[str, str], stats: ExtractionStats | None = None) -> bool:
+    """Validate a single content file and write it with text moved to the string table."""
     # Validate first
     result = os.system(f"python3 {VALIDATOR} {src} > /dev/null 2>&1")
     if result != 0:
         return False
 
-    # Copy to output
+    try:
+        raw = src.read_bytes()
+        original = loads(raw)
+        # Parsed twice rather than deep-copied; extraction rewrites data in place
+        data = loads(raw)
+    except (OSError, JSONDecodeError):
+        return False
+
+    content_type = src.parent.name
+    if stats is not None:
+        collect_stats(original, content_type, stats)
+    try:
+        extract_strings(data, content_type, table)
+    except ValueError as e:
+        print(f"  {src.name}: {e}")
+        return False
+
+    # Round trip: the generated file must resolve back to the source exactly
+    if resolve_strings(data, table) != original:
+        print(f"  {src.name}: string table round trip mismatch")
+        return False
+
     dest = out_dir / src.name
-    shutil.copy2(src, dest)
+    write_json(dest, data)
+
+    if src.parent.name == "levels":
+        return _build_spatial_index(src)
+    return True
+
+
+def _build_spatial_index(level_path: Path) -> bool:
+    """Write the per-level interactable spatial index."""
+    try:
+        level = loads(level_path.read_bytes())
+    except (OSError, JSONDecodeError):
+        return False
+
+    SPATIAL_DIR.mkdir(parents=True, exist_ok=True)
+    write_json(SPATIAL_DIR / level_path.name, build_level_index(level), pretty=True)
     return True
 
 
@@ -74,6 +146,9 @@ def watch_mode():
     """Watch content directory for changes and rebuild."""
     print("Watching for content changes... (Ctrl+C to stop)")
     mtimes: dict[str, float] = {}
+    table = load_string_table(STRING_TABLE_PATH)
+    # Walk godot_project/ once; only rescan when a directory changes
+    project_index = ProjectFileIndex()
 
     # Initial scan
     for subdir in CONTENT_SUBDIRS:
@@ -97,12 +172,28 @@ def watch_mode():
                     print(f"\nChange detected: {f.name}")
                     out_dir = OUTPUT_DIR / subdir
                     out_dir.mkdir(parents=True, exist_ok=True)
-                    if _build_file(f, out_dir):
+                    if _build_file(f, out_dir, table):
+                        write_string_table(table, STRING_TABLE_PATH)
                         print(f"  Rebuilt: {f.name}")
+                        print(f"  {delta_summary(write_build_manifest(OUTPUT_DIR))}")
+                        _report_assets(f, project_index)
                     else:
                         print(f"  Build FAILED: {f.name}")
 
 
+def _report_assets(path: Path, project_index: ProjectFileIndex):
+    """Print unresolved asset references in a rebuilt file (does not fail the build)."""
+    if project_index.is_stale():
+        project_index.refresh()
+    data, err = load_json(path)
+    if err or not data:
+        return
+    result = ValidationResult()
+    lint_assets(data, path.parent.name, project_index, result)
+    for w in result.warnings:
+        print(f"  WARN:  {w}")
+
+
 def main():
     args = sys.argv[1:]
 
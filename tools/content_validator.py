@@ -9,15 +9,19 @@ Usage:
     python content_validator.py --check-graph    # validate region connectivity
     python content_validator.py --check-balance  # validate reward balance
     python content_validator.py --check-coverage # validate skill tag coverage
+    python content_validator.py --check-assets   # validate asset references against godot_project/
+    python content_validator.py --check-difficulty # analyze difficulty curves and quest balance
 """
 
-import json
 import os
 import sys
 import re
 from pathlib import Path
 from typing import Any
 
+from json_backend import JSONDecodeError, read_json
+from spatial_index import build_kdtree, within_radius
+
 # Try to import jsonschema; provide install hint if missing
 try:
     import jsonschema
@@ -28,6 +32,7 @@ except ImportError:
 
 CONTENT_DIR = Path(__file__).parent.parent / "content"
 SCHEMA_DIR = CONTENT_DIR / "schemas"
+GODOT_DIR = CONTENT_DIR.parent / "godot_project"
 
 # Maps content directory names to their schema file
 SCHEMA_MAP = {
@@ -38,6 +43,31 @@ SCHEMA_MAP = {
     "dialogues": "dialogue.schema.json",
 }
 
+# Playable area of a region, matching the Camera2D limits in region_base.tscn
+REGION_BOUNDS = (-100.0, -200.0, 1400.0, 600.0)  # left, top, right, bottom
+# Top edge of World/Ground in region_base.tscn — anything below is buried
+GROUND_TOP_Y = 490.0
+# Interactables closer than the player's interact_radius (player_controller.gd,
+# interact_shape in region_base.tscn) overlap: both would be in reach at once
+MIN_INTERACTABLE_SEPARATION = 40.0
+# More than CLUSTER_MAX_NEIGHBORS within CLUSTER_RADIUS is flagged as crowded
+CLUSTER_RADIUS = 96.0
+CLUSTER_MAX_NEIGHBORS = 4
+
+# Name-based asset references resolve to a file with that stem under these
+# godot_project/ directories (any extension). The asset dirs follow the
+# layout in docs/ARCHITECTURE.md; nothing defines where task visual
+# templates live yet, so "visual" is an assumed location.
+ASSET_REFERENCE_DIRS = {
+    "parallax_layers": "assets/sprites/environments",
+    "particles": "assets/sprites/effects",
+    "visual": "scenes/puzzles/visuals",
+    "tilemap": "assets/tilesets",
+}
+# Skipped when indexing the project: editor cache, build output, import sidecars
+INDEX_SKIP_DIRS = {".godot", "resources/generated"}
+INDEX_SKIP_SUFFIXES = (".import", ".uid")
+
 
 class ValidationResult:
     def __init__(self):
@@ -73,15 +103,13 @@ def load_schema(schema_name: str) -> dict | None:
     path = SCHEMA_DIR / schema_name
     if not path.exists():
         return None
-    with open(path) as f:
-        return json.load(f)
+    return read_json(path)
 
 
 def load_json(path: Path) -> tuple[dict | None, str | None]:
     try:
-        with open(path) as f:
-            return json.load(f), None
-    except json.JSONDecodeError as e:
+        return read_json(path), None
+    except JSONDecodeError as e:
         return None, f"Invalid JSON: {e}"
     except Exception as e:
         return None, f"Could not read file: {e}"
@@ -109,6 +137,7 @@ def lint_level(data: dict, result: ValidationResult):
     interactables = data.get("interactables", [])
     if len(interactables) < 8:
         result.error(f"{level_id}: Must have at least 8 interactables, found {len(interactables)}")
+    lint_interactable_placement(data, result)
 
     # Check minimum traversal
     traversal = data.get("traversal", [])
@@ -147,6 +176,44 @@ def lint_level(data: dict, result: ValidationResult):
         result.warn(f"{level_id}: Should have at least 2 mini-games, found {len(mini_games)}")
 
 
+def lint_interactable_placement(data: dict, result: ValidationResult):
+    """Flag out-of-bounds, buried, overlapping and crowded interactables."""
+    level_id = data.get("level_id", "unknown")
+    interactables = data.get("interactables", [])
+    tree = build_kdtree(interactables)
+    left, top, right, bottom = REGION_BOUNDS
+
+    # Spatial index and nearest-interactable results are keyed by id
+    seen_ids: set[str] = set()
+    for item in interactables:
+        if not isinstance(item, dict) or "id" not in item:
+            continue
+        item_id = str(item["id"])
+        if item_id in seen_ids:
+            result.error(f"{level_id}: Duplicate interactable id '{item_id}'")
+        seen_ids.add(item_id)
+
+    # Pairs are deduplicated by tree slot, not id, so same-id entries are still compared
+    slot = {id(n): i for i, n in enumerate(tree)}
+    for i, node in enumerate(tree):
+        x, y = node["position"]
+        if not (left <= x <= right and top <= y <= bottom):
+            result.error(f"{level_id}: Interactable '{node['id']}' at ({x:g}, {y:g}) is outside region bounds")
+        elif y > GROUND_TOP_Y:
+            result.error(f"{level_id}: Interactable '{node['id']}' at ({x:g}, {y:g}) is below ground and unreachable")
+
+        neighbors = [n for n in within_radius(tree, (x, y), CLUSTER_RADIUS) if n is not node]
+        for other in neighbors:
+            if slot[id(other)] <= i:
+                continue
+            ox, oy = other["position"]
+            if (ox - x) ** 2 + (oy - y) ** 2 < MIN_INTERACTABLE_SEPARATION ** 2:
+                first, second = sorted((str(node["id"]), str(other["id"])))
+                result.error(f"{level_id}: Interactables '{first}' and '{second}' overlap")
+        if len(neighbors) > CLUSTER_MAX_NEIGHBORS:
+            result.warn(f"{level_id}: Interactable '{node['id']}' has {len(neighbors)} neighbors within {CLUSTER_RADIUS:g}px (crowded)")
+
+
 def lint_task(data: dict, result: ValidationResult):
     """Task-specific lint rules."""
     task_id = data.get("task_id", "unknown")
@@ -340,6 +407,140 @@ def check_skill_coverage(result: ValidationResult):
         result.warn(f"Task skill tags not used in any level: {sorted(uncovered)}")
 
 
+# --- Asset Checks ---
+
+class ProjectFileIndex:
+    """In-memory index of every file under the Godot project.
+
+    Built with a single directory walk so asset references resolve with set
+    and dict lookups instead of one exists() call each. Directory mtimes are
+    kept so a long-lived index (watch mode) can tell when to rescan.
+    """
+
+    def __init__(self, root: Path = GODOT_DIR):
+        self.root = root
+        self.paths: set[str] = set()
+        self.stems: dict[str, list[str]] = {}
+        self._dir_mtimes: dict[str, float] = {}
+        self.refresh()
+
+    def refresh(self):
+        self.paths.clear()
+        self.stems.clear()
+        self._dir_mtimes.clear()
+        if not self.root.exists():
+            return
+        for dirpath, dirnames, filenames in os.walk(self.root):
+            rel_dir = os.path.relpath(dirpath, self.root).replace(os.sep, "/")
+            rel_dir = "" if rel_dir == "." else rel_dir
+            dirnames[:] = [d for d in dirnames if f"{rel_dir}/{d}".lstrip("/") not in INDEX_SKIP_DIRS]
+            self._dir_mtimes[dirpath] = os.stat(dirpath).st_mtime
+            for name in filenames:
+                if name.endswith(INDEX_SKIP_SUFFIXES):
+                    continue
+                rel = f"{rel_dir}/{name}" if rel_dir else name
+                self.paths.add(rel)
+                self.stems.setdefault(name.split(".", 1)[0], []).append(rel)
+
+    def is_stale(self) -> bool:
+        """True if any indexed directory gained, lost or renamed an entry."""
+        for dirpath, mtime in self._dir_mtimes.items():
+            try:
+                if os.stat(dirpath).st_mtime != mtime:
+                    return True
+            except FileNotFoundError:
+                return True
+        return False
+
+    def has_path(self, res_path: str) -> bool:
+        return res_path.removeprefix("res://") in self.paths
+
+    def find_stem(self, stem: str, under: str) -> str | None:
+        prefix = under.rstrip("/") + "/"
+        for rel in self.stems.get(stem, []):
+            if rel.startswith(prefix):
+                return rel
+        return None
+
+    def files_under(self, under: str) -> list[str]:
+        prefix = under.rstrip("/") + "/"
+        return sorted(p for p in self.paths if p.startswith(prefix))
+
+
+def collect_asset_refs(data: Any, content_type: str) -> list[tuple[str, str, str]]:
+    """Return (kind, reference, owner_id) for every asset reference in data."""
+    refs = []
+    items = data if isinstance(data, list) else [data]
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+        if content_type == "levels":
+            owner = item.get("level_id", "unknown")
+            env = item.get("environment") or {}
+            if env.get("tilemap"):
+                refs.append(("tilemap", env["tilemap"], owner))
+            for layer in env.get("parallax_layers") or []:
+                refs.append(("parallax_layers", layer, owner))
+            for particle in env.get("particles") or []:
+                refs.append(("particles", particle, owner))
+        elif content_type == "tasks":
+            visual_type = (item.get("visual") or {}).get("type")
+            if visual_type:
+                refs.append(("visual", visual_type, item.get("task_id", "unknown")))
+    return refs
+
+
+def resolve_asset_ref(kind: str, ref: str, index: ProjectFileIndex) -> str | None:
+    """Return the project-relative path a reference resolves to, or None."""
+    if ref.startswith("res://"):
+        return ref.removeprefix("res://") if index.has_path(ref) else None
+    return index.find_stem(ref, ASSET_REFERENCE_DIRS[kind])
+
+
+def lint_assets(data: Any, content_type: str, index: ProjectFileIndex, result: ValidationResult) -> set[str]:
+    """Report unresolved asset references in one content file. Returns resolved paths.
+
+    Missing assets are warnings: the art is still placeholder, so content is
+    expected to reference files that do not exist yet.
+    """
+    used = set()
+    for kind, ref, owner in collect_asset_refs(data, content_type):
+        resolved = resolve_asset_ref(kind, ref, index)
+        if resolved is None:
+            if ref.startswith("res://"):
+                result.warn(f"{owner}: Missing {kind} asset '{ref}'")
+            else:
+                result.warn(f"{owner}: Missing {kind} asset '{ref}' (expected res://{ASSET_REFERENCE_DIRS[kind]}/{ref}.*)")
+        else:
+            used.add(resolved)
+    return used
+
+
+def check_asset_references(result: ValidationResult, index: ProjectFileIndex | None = None):
+    """Resolve every asset reference in levels and tasks; report missing and unused assets."""
+    index = index or ProjectFileIndex()
+    used: set[str] = set()
+    total_refs = 0
+
+    for content_type in ["levels", "tasks"]:
+        src_dir = CONTENT_DIR / content_type
+        if not src_dir.exists():
+            continue
+        for f in sorted(src_dir.glob("*.json")):
+            data, err = load_json(f)
+            if err or not data:
+                continue
+            total_refs += len(collect_asset_refs(data, content_type))
+            used |= lint_assets(data, content_type, index, result)
+
+    for under in sorted(set(ASSET_REFERENCE_DIRS.values())):
+        for rel in index.files_under(under):
+            if rel not in used:
+                result.warn(f"Unused asset: res://{rel}")
+
+    result.add_info(f"Indexed {len(index.paths)} project files; resolved {len(used)} assets from {total_refs} references")
+
+
 # --- Main validation ---
 
 def validate_file(path: Path) -> ValidationResult:
@@ -390,7 +591,7 @@ def main():
     args = sys.argv[1:]
 
     if not args:
-        print("Usage: python content_validator.py [--all | --check-graph | --check-balance | --check-coverage | <path>]")
+        print("Usage: python content_validator.py [--all | --check-graph | --check-balance | --check-coverage | --check-assets | --check-difficulty | <path>]")
         sys.exit(1)
 
     total_errors = 0
@@ -428,6 +629,24 @@ def main():
         print(result.summary())
         total_errors += len(result.errors)
 
+    if "--check-assets" in args:
+        print("\n=== Asset References ===\n")
+        result = ValidationResult()
+        check_asset_references(result)
+        print(result.summary())
+        total_errors += len(result.errors)
+        total_warnings += len(result.warnings)
+
+    if "--check-difficulty" in args:
+        # Imported here so per-file validation (run once per file by the build) skips numpy
+        from difficulty_analyzer import check_difficulty_curve
+        print("\n=== Difficulty Curve ===\n")
+        result = ValidationResult()
+        check_difficulty_curve(result)
+        print(result.summary())
+        total_errors += len(result.errors)
+        total_warnings += len(result.warnings)
+
     # Validate specific path
     for arg in args:
         if arg.startswith("--"):
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Whips Delta Manifest
+Tracks which content records changed between builds.
+
+Every record in the generated output (each task in a task bank, each
+level, zone, page or dialogue) is hashed. A build compares those hashes
+with the previous manifest.json, bumps the build generation and writes
+delta.json listing added, modified and removed IDs. ContentLoader.gd
+uses the delta to patch only the affected entries in its cache.
+
+Usage:
+    python delta_manifest.py <old_output_dir> <new_output_dir>   # diff two builds
+"""
+
+import hashlib
+import json
+import sys
+from pathlib import Path
+from typing import Any
+
+from json_backend import JSONDecodeError, read_json, write_json
+
+MANIFEST_NAME = "manifest.json"
+DELTA_NAME = "delta.json"
+
+# Same ID keys as ContentLoader._get_id_key()
+ID_KEYS = {
+    "zones": "zone_id",
+    "levels": "level_id",
+    "tasks": "task_id",
+    "reference_pages": "page_id",
+    "dialogues": "dialogue_id",
+}
+
+
+def hash_record(record: Any) -> str:
+    """Hash a record independent of key order and whitespace.
+
+    Always serialized with the stdlib encoder so hashes do not depend on
+    which JSON backend is active.
+    """
+    canonical = json.dumps(record, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha1(canonical.encode("utf-8")).hexdigest()[:16]
+
+
+def load_records(output_dir: Path) -> dict[str, dict[str, tuple[str, Any]]]:
+    """Load every record in a build output as {type: {id: (file, record)}}."""
+    records: dict[str, dict[str, tuple[str, Any]]] = {}
+    for content_type, id_key in ID_KEYS.items():
+        type_dir = output_dir / content_type
+        if not type_dir.exists():
+            continue
+        by_id: dict[str, tuple[str, Any]] = {}
+        for f in sorted(type_dir.glob("*.json")):
+            try:
+                data = read_json(f)
+            except (OSError, JSONDecodeError):
+                continue
+            items = data if isinstance(data, list) else [data]
+            for i, item in enumerate(items):
+                rid = item.get(id_key) if isinstance(item, dict) else None
+                by_id[rid or f"{f.name}#{i}"] = (f.name, item)
+        records[content_type] = by_id
+    return records
+
+
+def _hash_records(records: dict[str, dict[str, tuple[str, Any]]]) -> dict[str, dict[str, dict]]:
+    return {
+        content_type: {rid: {"file": fname, "hash": hash_record(rec)} for rid, (fname, rec) in by_id.items()}
+        for content_type, by_id in records.items()
+    }
+
+
+def record_hashes(output_dir: Path) -> dict[str, dict[str, dict]]:
+    """Hash every record in a build output as {type: {id: {"file", "hash"}}}."""
+    return _hash_records(load_records(output_dir))
+
+
+def diff_hashes(old: dict[str, dict[str, dict]], new: dict[str, dict[str, dict]]) -> dict[str, dict]:
+    """Compare two record hash maps. Only content types with changes are returned."""
+    changes = {}
+    for content_type in sorted(set(old) | set(new)):
+        before = old.get(content_type, {})
+        after = new.get(content_type, {})
+        added = sorted(set(after) - set(before))
+        removed = sorted(set(before) - set(after))
+        modified = sorted(
+            rid for rid in set(before) & set(after)
+            if before[rid]["hash"] != after[rid]["hash"]
+        )
+        if not (added or removed or modified):
+            continue
+        changes[content_type] = {
+            "added": added,
+            "modified": modified,
+            "removed": removed,
+            # Generated files the runtime has to re-read to pick up the changes
+            "files": sorted({after[rid]["file"] for rid in added + modified}),
+        }
+    return changes
+
+
+def load_manifest(output_dir: Path) -> dict:
+    path = output_dir / MANIFEST_NAME
+    if not path.exists():
+        return {"generation": 0, "records": {}}
+    return read_json(path)
+
+
+def write_build_manifest(output_dir: Path) -> dict:
+    """Record this build: bump the generation, write manifest.json and delta.json.
+
+    Returns the delta.
+    """
+    previous = load_manifest(output_dir)
+    hashes = record_hashes(output_dir)
+    generation = previous.get("generation", 0) + 1
+
+    delta = {
+        "generation": generation,
+        "previous_generation": previous.get("generation", 0),
+        "changes": diff_hashes(previous.get("records", {}), hashes),
+    }
+    write_json(output_dir / MANIFEST_NAME, {"generation": generation, "records": hashes}, pretty=True, sort_keys=True)
+    write_json(output_dir / DELTA_NAME, delta, pretty=True, sort_keys=True)
+    return delta
+
+
+def delta_summary(delta: dict) -> str:
+    added = sum(len(c["added"]) for c in delta["changes"].values())
+    modified = sum(len(c["modified"]) for c in delta["changes"].values())
+    removed = sum(len(c["removed"]) for c in delta["changes"].values())
+    return f"Generation {delta['generation']}: {added} added, {modified} modified, {removed} removed"
+
+
+def _changed_keys(before: Any, after: Any) -> list[str]:
+    if not isinstance(before, dict) or not isinstance(after, dict):
+        return []
+    return sorted(k for k in set(before) | set(after) if before.get(k) != after.get(k))
+
+
+def main():
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    if len(args) != 2:
+        print("Usage: python delta_manifest.py <old_output_dir> <new_output_dir>")
+        sys.exit(1)
+
+    old_dir, new_dir = Path(args[0]), Path(args[1])
+    for d in (old_dir, new_dir):
+        if not d.is_dir():
+            print(f"Not found: {d}")
+            sys.exit(1)
+
+    old_records = load_records(old_dir)
+    new_records = load_records(new_dir)
+    changes = diff_hashes(_hash_records(old_records), _hash_records(new_records))
+
+    if not changes:
+        print("No record-level changes")
+        return
+
+    for content_type, change in changes.items():
+        print(f"\n=== {content_type} ===")
+        for rid in change["added"]:
+            print(f"  + {rid}")
+        for rid in change["modified"]:
+            keys = _changed_keys(old_records[content_type][rid][1], new_records[content_type][rid][1])
+            print(f"  ~ {rid} ({', '.join(keys)})" if keys else f"  ~ {rid}")
+        for rid in change["removed"]:
+            print(f"  - {rid}")
+
+
+if __name__ == "__main__":
+    main()
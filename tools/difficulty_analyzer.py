@@ -0,0 +1,394 @@
+#!/usr/bin/env python3
+"""
+Whips Difficulty Analyzer
+Analyzes difficulty progression and quest balance across the curriculum.
+
+All tasks are loaded into columnar numpy arrays (difficulty, hint count,
+level, quest stage, quest position, plus flattened (task, skill tag)
+pairs so multi-tag tasks count toward every tag), and every
+statistic is computed with grouped array operations rather than per-task
+loops, so the pass stays around a second even for 100k tasks.
+
+Checks:
+    - per-level stage curve (warmup -> teach -> practice -> apply -> boss):
+      spikes, drops, and bosses that are not the hardest stage
+    - task-to-task difficulty jumps in quest order
+    - per-zone level curve: spikes and drops between consecutive levels
+    - hints per difficulty band: harder bands should not get fewer hints
+    - skill tag imbalance: tags with far fewer tasks than the median
+
+Usage:
+    python difficulty_analyzer.py                    # analyze content/
+    python difficulty_analyzer.py --json <path>      # also write the report as JSON
+    python difficulty_analyzer.py --synthetic 100000 # time a synthetic curriculum
+"""
+
+import random
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+from content_validator import load_json
+from json_backend import write_json
+
+# Try to import numpy; provide install hint if missing
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+CONTENT_DIR = Path(__file__).parent.parent / "content"
+
+STAGES = ("warmup", "teach", "practice", "apply", "boss")
+BOSS = STAGES.index("boss")
+UNPLACED = (-1, -1, -1)
+
+# Mean difficulty rise between consecutive quest stages that counts as a spike
+STAGE_SPIKE = 2.0
+# Mean difficulty fall between consecutive quest stages that is tolerated
+STAGE_DROP_TOLERANCE = 0.5
+# Difficulty rise between consecutive quest tasks that counts as a spike
+TASK_SPIKE = 3
+# Mean difficulty change between consecutive levels in a zone
+LEVEL_SPIKE = 1.5
+LEVEL_DROP_TOLERANCE = 0.5
+# Harder bands may average this many fewer hints before being flagged
+HINT_TOLERANCE = 0.25
+# Skill tags with fewer tasks than this fraction of the median are flagged
+SKILL_MIN_FRACTION = 0.25
+
+_LEVEL_FILE_RE = re.compile(r"^(level_\d{2})_")
+
+
+class CurriculumColumns:
+    """Columnar view of every task in the curriculum.
+
+    Per-task arrays share one index. level/stage/position are -1 for tasks
+    no quest_line references; codes index into the matching vocab list.
+    tag_task/tag_code hold one (task index, skill code) pair per skill tag.
+    """
+
+    def __init__(self, task_ids: list[str], difficulty, hints, tag_task, tag_code, level, stage, position,
+                 skill_vocab: list[str], level_ids: list[str], level_zone, zone_ids: list[str],
+                 missing_refs: list[tuple[str, str]]):
+        self.task_ids = task_ids
+        self.difficulty = difficulty
+        self.hints = hints
+        self.tag_task = tag_task
+        self.tag_code = tag_code
+        self.level = level
+        self.stage = stage
+        self.position = position
+        self.skill_vocab = skill_vocab
+        self.level_ids = level_ids
+        self.level_zone = level_zone
+        self.zone_ids = zone_ids
+        # (level_id, task_id) quest references with no task data
+        self.missing_refs = missing_refs
+
+    def __len__(self) -> int:
+        return len(self.task_ids)
+
+
+def build_columns(levels: list[dict], tasks: list[dict]) -> CurriculumColumns:
+    """Flatten level quest lines and task banks into arrays."""
+    levels = sorted(levels, key=lambda lv: lv.get("level_id", ""))
+    level_ids = [lv.get("level_id", "") for lv in levels]
+    zone_vocab: dict[str, int] = {}
+    level_zone = np.fromiter(
+        (zone_vocab.setdefault(lv.get("zone_id", ""), len(zone_vocab)) for lv in levels),
+        dtype=np.int32, count=len(levels),
+    )
+
+    # task_id -> (level, stage, position in quest order); first placement wins
+    placement: dict[str, tuple[int, int, int]] = {}
+    for li, lv in enumerate(levels):
+        quest = lv.get("quest_line", {})
+        pos = 0
+        for si, stage in enumerate(STAGES):
+            ids = quest.get(stage) or []
+            for tid in ids if isinstance(ids, list) else [ids]:
+                placement.setdefault(tid, (li, si, pos))
+                pos += 1
+
+    n = len(tasks)
+    task_ids = [t.get("task_id", "") for t in tasks]
+    difficulty = np.fromiter((t.get("difficulty", 0) for t in tasks), dtype=np.int16, count=n)
+    hints = np.fromiter((len(t.get("hints", [])) for t in tasks), dtype=np.int16, count=n)
+    tags = [t.get("skill_tags") if isinstance(t.get("skill_tags"), list) else [] for t in tasks]
+    tag_counts = np.fromiter((len(tt) for tt in tags), dtype=np.int64, count=n)
+    tag_task = np.repeat(np.arange(n, dtype=np.int32), tag_counts)
+    skill_vocab: dict[str, int] = {}
+    tag_code = np.fromiter(
+        (skill_vocab.setdefault(tag, len(skill_vocab)) for tt in tags for tag in tt),
+        dtype=np.int32, count=len(tag_task),
+    )
+    placed = np.array([placement.get(tid, UNPLACED) for tid in task_ids], dtype=np.int32).reshape(n, 3)
+
+    known = set(task_ids)
+    missing_refs = sorted((level_ids[li], tid) for tid, (li, _, _) in placement.items() if tid not in known)
+
+    return CurriculumColumns(
+        task_ids, difficulty, hints, tag_task, tag_code,
+        placed[:, 0], placed[:, 1], placed[:, 2],
+        list(skill_vocab), level_ids, level_zone, list(zone_vocab), missing_refs,
+    )
+
+
+def load_curriculum(content_dir: Path = CONTENT_DIR) -> CurriculumColumns:
+    """Load levels and task banks; files that fail to load are skipped."""
+    levels: list[dict] = []
+    for f in sorted((content_dir / "levels").glob("*.json")):
+        data, err = load_json(f)
+        if err or not isinstance(data, dict):
+            continue
+        levels.append(data)
+    tasks: list[dict] = []
+    for f in sorted((content_dir / "tasks").glob("*.json")):
+        data, err = load_json(f)
+        if err or not data:
+            continue
+        tasks.extend(t for t in (data if isinstance(data, list) else [data]) if isinstance(t, dict))
+    return build_columns(levels, tasks)
+
+
+def _grouped_mean(keys, values, size: int):
+    """Mean of values per integer key in [0, size); NaN for empty groups."""
+    counts = np.bincount(keys, minlength=size)
+    sums = np.bincount(keys, weights=values, minlength=size)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return sums / counts, counts
+
+
+def _round(values) -> list:
+    return [None if np.isnan(v) else round(float(v), 2) for v in values]
+
+
+def analyze(cols: CurriculumColumns) -> dict[str, Any]:
+    """Compute curves, spikes and imbalance statistics. Returns a JSON-ready report."""
+    findings: list[str] = []
+    n_levels, n_stages = len(cols.level_ids), len(STAGES)
+    placed = cols.level >= 0
+    lvl, stg = cols.level[placed], cols.stage[placed]
+    diff = cols.difficulty[placed].astype(np.float64)
+
+    # --- Per-level stage curves ---
+    stage_mean, stage_count = _grouped_mean(lvl * n_stages + stg, diff, n_levels * n_stages)
+    stage_mean = stage_mean.reshape(n_levels, n_stages)
+    present = stage_count.reshape(n_levels, n_stages) > 0
+
+    # Compare each present stage with the previous present stage in the same level
+    cols_idx = np.broadcast_to(np.arange(n_stages), (n_levels, n_stages))
+    last_present = np.maximum.accumulate(np.where(present, cols_idx, -1), axis=1)
+    prev = np.concatenate([np.full((n_levels, 1), -1), last_present[:, :-1]], axis=1)
+    prev_mean = np.take_along_axis(stage_mean, np.clip(prev, 0, None), axis=1)
+    has_prev = present & (prev >= 0)
+    stage_delta = np.where(has_prev, stage_mean - prev_mean, 0.0)
+
+    for li, si in zip(*np.nonzero(stage_delta > STAGE_SPIKE)):
+        findings.append(f"{cols.level_ids[li]}: difficulty spike {STAGES[prev[li, si]]} -> {STAGES[si]} "
+                        f"(+{stage_delta[li, si]:.2f})")
+    for li, si in zip(*np.nonzero(stage_delta < -STAGE_DROP_TOLERANCE)):
+        findings.append(f"{cols.level_ids[li]}: difficulty drops {STAGES[prev[li, si]]} -> {STAGES[si]} "
+                        f"({stage_delta[li, si]:.2f})")
+
+    hardest_other = np.where(present[:, :BOSS], stage_mean[:, :BOSS], -np.inf).max(axis=1)
+    weak_boss = present[:, BOSS] & (stage_mean[:, BOSS] < hardest_other)
+    for li in np.nonzero(weak_boss)[0]:
+        findings.append(f"{cols.level_ids[li]}: boss ({stage_mean[li, BOSS]:.2f}) is easier than "
+                        f"the hardest earlier stage ({hardest_other[li]:.2f})")
+
+    # --- Task-to-task jumps in quest order ---
+    placed_idx = np.nonzero(placed)[0]
+    order = placed_idx[np.lexsort((cols.position[placed_idx], cols.level[placed_idx]))]
+    jump = np.diff(cols.difficulty[order].astype(np.int32))
+    same_level = cols.level[order][1:] == cols.level[order][:-1]
+    for k in np.nonzero(same_level & (jump >= TASK_SPIKE))[0]:
+        a, b = order[k], order[k + 1]
+        findings.append(f"{cols.level_ids[cols.level[a]]}: {cols.task_ids[a]} ({cols.difficulty[a]}) -> "
+                        f"{cols.task_ids[b]} ({cols.difficulty[b]}) jumps +{jump[k]}")
+
+    # --- Per-zone level curves (levels are sorted by level_id) ---
+    level_mean, level_count = _grouped_mean(lvl, diff, n_levels)
+    has_tasks = level_count > 0
+    level_jump = np.diff(level_mean)
+    consecutive = (cols.level_zone[1:] == cols.level_zone[:-1]) & has_tasks[1:] & has_tasks[:-1]
+    for k in np.nonzero(consecutive & (level_jump > LEVEL_SPIKE))[0]:
+        findings.append(f"{cols.zone_ids[cols.level_zone[k]]}: {cols.level_ids[k]} -> {cols.level_ids[k + 1]} "
+                        f"mean difficulty jumps +{level_jump[k]:.2f}")
+    for k in np.nonzero(consecutive & (level_jump < -LEVEL_DROP_TOLERANCE))[0]:
+        findings.append(f"{cols.zone_ids[cols.level_zone[k]]}: {cols.level_ids[k]} -> {cols.level_ids[k + 1]} "
+                        f"mean difficulty drops {level_jump[k]:.2f}")
+
+    zone_mean, zone_count = _grouped_mean(cols.level_zone[lvl], diff, len(cols.zone_ids))
+
+    # --- Hints per difficulty band ---
+    bands = np.clip(cols.difficulty, 0, 5)
+    band_hints, band_count = _grouped_mean(bands, cols.hints.astype(np.float64), 6)
+    no_hints = np.bincount(bands[cols.hints == 0], minlength=6)
+    band_present = np.nonzero(band_count[1:] > 0)[0] + 1
+    for lo, hi in zip(band_present[:-1], band_present[1:]):
+        if band_hints[hi] < band_hints[lo] - HINT_TOLERANCE:
+            findings.append(f"Difficulty {hi} tasks average fewer hints ({band_hints[hi]:.2f}) "
+                            f"than difficulty {lo} ({band_hints[lo]:.2f})")
+
+    # --- Skill tag balance ---
+    tag_difficulty = cols.difficulty[cols.tag_task].astype(np.float64)
+    skill_mean, skill_count = _grouped_mean(cols.tag_code, tag_difficulty, len(cols.skill_vocab))
+    if len(skill_count):
+        median = float(np.median(skill_count))
+        cv = float(skill_count.std() / skill_count.mean())
+        for si in np.nonzero(skill_count < median * SKILL_MIN_FRACTION)[0]:
+            findings.append(f"Skill tag '{cols.skill_vocab[si]}' has {skill_count[si]} tasks "
+                            f"(median {median:g})")
+    else:
+        median, cv = 0.0, 0.0
+
+    for level_id, tid in cols.missing_refs:
+        findings.append(f"{level_id}: quest_line references '{tid}' but no task defines it")
+
+    return {
+        "tasks": len(cols),
+        "placed_tasks": int(placed.sum()),
+        "levels": {
+            level_id: {
+                "zone": cols.zone_ids[cols.level_zone[li]],
+                "mean_difficulty": _round(level_mean[li:li + 1])[0],
+                "stage_curve": dict(zip(STAGES, _round(stage_mean[li]))),
+                "stage_counts": dict(zip(STAGES, stage_count.reshape(n_levels, n_stages)[li].tolist())),
+            }
+            for li, level_id in enumerate(cols.level_ids)
+        },
+        "zones": {
+            zone_id: {
+                "mean_difficulty": _round(zone_mean[zi:zi + 1])[0],
+                "tasks": int(zone_count[zi]),
+                "level_curve": _round(level_mean[cols.level_zone == zi]),
+            }
+            for zi, zone_id in enumerate(cols.zone_ids)
+        },
+        "hint_bands": {
+            str(b): {"tasks": int(band_count[b]), "mean_hints": _round(band_hints[b:b + 1])[0],
+                     "no_hints": int(no_hints[b])}
+            for b in range(1, 6)
+        },
+        "skills": {
+            "count_cv": round(cv, 3),
+            "median_count": median,
+            "tags": {
+                tag: {"tasks": int(skill_count[si]), "mean_difficulty": _round(skill_mean[si:si + 1])[0]}
+                for si, tag in enumerate(cols.skill_vocab)
+            },
+        },
+        "findings": findings,
+    }
+
+
+def check_difficulty_curve(result, content_dir: Path = CONTENT_DIR):
+    """Validator hook: report analyzer findings as warnings on a ValidationResult."""
+    if not HAS_NUMPY:
+        result.warn("numpy not installed — skipping difficulty analysis. Install with: pip install numpy")
+        return
+    report = analyze(load_curriculum(content_dir))
+    for finding in report["findings"]:
+        result.warn(finding)
+    result.add_info(f"Analyzed {report['tasks']} tasks ({report['placed_tasks']} in quest lines) "
+                    f"across {len(report['levels'])} levels")
+
+
+def synthetic_curriculum(n_tasks: int, tasks_per_level: int = 40, levels_per_zone: int = 8,
+                         seed: int = 1) -> tuple[list[dict], list[dict]]:
+    """Generate levels and tasks shaped like real content for benchmarking."""
+    rng = random.Random(seed)
+    n_levels = max(1, n_tasks // tasks_per_level)
+    stage_sizes = (1, 6, 20, 12, 1)
+    levels, tasks = [], []
+    for li in range(n_levels):
+        base = 1 + (li % levels_per_zone) * 3 // levels_per_zone
+        quest: dict[str, Any] = {}
+        for si, (stage, size) in enumerate(zip(STAGES, stage_sizes)):
+            ids = []
+            for k in range(size):
+                tid = f"task_syn_{li:05d}_{stage}_{k:02d}"
+                ids.append(tid)
+                tasks.append({
+                    "task_id": tid,
+                    "difficulty": min(5, base + si // 2 + (rng.random() < 0.1)),
+                    "hints": [{"level": h + 1, "text": "hint"} for h in range(rng.randint(1, 4))],
+                    "skill_tags": [f"skill_{li % 200:03d}"],
+                })
+            quest[stage] = ids if stage not in ("warmup", "boss") else ids[0]
+        levels.append({
+            "level_id": f"level_{li:05d}",
+            "zone_id": f"zone_{li // levels_per_zone + 1}",
+            "quest_line": quest,
+        })
+    return levels, tasks[:n_tasks] if len(tasks) > n_tasks else tasks
+
+
+def print_report(report: dict):
+    print(f"Tasks: {report['tasks']} ({report['placed_tasks']} in quest lines)")
+
+    print("\n--- Stage curves (mean difficulty) ---")
+    print(f"  {'level':<12}" + "".join(f"{s:>10}" for s in STAGES))
+    for level_id, data in list(report["levels"].items())[:50]:
+        cells = "".join(f"{'-' if v is None else v:>10}" for v in data["stage_curve"].values())
+        print(f"  {level_id:<12}{cells}")
+    if len(report["levels"]) > 50:
+        print(f"  ... {len(report['levels']) - 50} more levels")
+
+    print("\n--- Zones ---")
+    for zone_id, data in report["zones"].items():
+        print(f"  {zone_id}: mean {data['mean_difficulty']}, {data['tasks']} tasks, "
+              f"{len(data['level_curve'])} levels")
+
+    print("\n--- Hints per difficulty band ---")
+    for band, data in report["hint_bands"].items():
+        print(f"  difficulty {band}: {data['tasks']} tasks, mean hints {data['mean_hints']}, "
+              f"{data['no_hints']} with none")
+
+    skills = report["skills"]
+    print(f"\n--- Skill tags: {len(skills['tags'])} tags, median {skills['median_count']:g} tasks, "
+          f"count CV {skills['count_cv']} ---")
+
+    print(f"\n--- Findings ({len(report['findings'])}) ---")
+    for finding in report["findings"][:100]:
+        print(f"  WARN:  {finding}")
+    if len(report["findings"]) > 100:
+        print(f"  ... {len(report['findings']) - 100} more")
+
+
+def main():
+    args = sys.argv[1:]
+    if not HAS_NUMPY:
+        print("numpy is required for difficulty analysis. Install with: pip install numpy")
+        sys.exit(1)
+
+    if "--synthetic" in args:
+        n = int(args[args.index("--synthetic") + 1])
+        levels, tasks = synthetic_curriculum(n)
+        start = time.perf_counter()
+        cols = build_columns(levels, tasks)
+        loaded = time.perf_counter()
+        report = analyze(cols)
+        done = time.perf_counter()
+        print(f"=== Synthetic curriculum: {len(tasks)} tasks, {len(levels)} levels ===\n")
+        print(f"Columns built in {(loaded - start) * 1000:.0f}ms, analyzed in {(done - loaded) * 1000:.0f}ms")
+        print(f"Findings: {len(report['findings'])}")
+        return
+
+    print("=== Difficulty Analysis ===\n")
+    report = analyze(load_curriculum())
+    print_report(report)
+
+    if "--json" in args:
+        out = Path(args[args.index("--json") + 1])
+        write_json(out, report, pretty=True)
+        print(f"\nReport written to {out}")
+
+
+if __name__ == "__main__":
+    main()
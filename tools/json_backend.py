@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Whips JSON Backend
+Single entry point for reading and writing content JSON.
+
+Uses orjson when it is installed and falls back to the stdlib json module
+otherwise. Files are read as bytes in one call and parsed directly; output
+is either minified or 2-space indented, always UTF-8 with a trailing
+newline. Both backends write NaN/Infinity as null (valid JSON, and what
+orjson does natively). orjson formats very large and very small floats
+differently (1e16 vs 1e+16, 0.00001 vs 1e-05); a fast byte scan spots
+those in orjson output and re-encodes with stdlib, so both backends write
+the same bytes.
+
+Set WHIPS_JSON_BACKEND=json to force the stdlib backend.
+
+Usage:
+    python json_backend.py              # print the active backend
+"""
+
+import json
+import math
+import os
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Same exception type for both backends (orjson.JSONDecodeError subclasses it)
+JSONDecodeError = json.JSONDecodeError
+
+
+def _nonfinite_to_none(obj: Any) -> Any:
+    """Copy of obj with NaN/Infinity floats replaced by None."""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {k: _nonfinite_to_none(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_nonfinite_to_none(v) for v in obj]
+    return obj
+
+
+class StdlibBackend:
+    name = "json"
+
+    def loads(self, data: bytes | str) -> Any:
+        return json.loads(data)
+
+    def dumps(self, obj: Any, pretty: bool = False, sort_keys: bool = False) -> bytes:
+        try:
+            return self._dumps(obj, pretty, sort_keys)
+        except ValueError:
+            # Non-finite float: write null like orjson instead of invalid NaN
+            return self._dumps(_nonfinite_to_none(obj), pretty, sort_keys)
+
+    def _dumps(self, obj: Any, pretty: bool, sort_keys: bool) -> bytes:
+        if pretty:
+            text = json.dumps(obj, indent=2, ensure_ascii=False, sort_keys=sort_keys, allow_nan=False)
+        else:
+            text = json.dumps(obj, separators=(",", ":"), ensure_ascii=False, sort_keys=sort_keys,
+                              allow_nan=False)
+        return text.encode("utf-8")
+
+
+# orjson writes some floats differently from stdlib: any exponent (1e16 vs
+# 1e+16, always a lowercase "e" after a digit) and |x| < 1e-4 as a plain
+# decimal (0.00001 vs 1e-05). Mapping digits to "0" lets a C-level find()
+# locate exponent candidates; hits inside strings are ruled out by
+# checking what precedes the number.
+_DIGITS_TO_ZERO = bytes.maketrans(b"123456789", b"000000000")
+_NUMBER_CHARS = frozenset(b"0.-+e")
+_VALUE_START = frozenset(b"[:, \n-")
+
+
+def _has_nonportable_float(data: bytes) -> bool:
+    digits = data.translate(_DIGITS_TO_ZERO)
+
+    pos = digits.find(b"0e")
+    while pos != -1:
+        start = pos
+        while start > 0 and digits[start - 1] in _NUMBER_CHARS:
+            start -= 1
+        if start == 0 or digits[start - 1] in _VALUE_START:
+            return True
+        pos = digits.find(b"0e", pos + 1)
+
+    # Real zeros are needed here, so search the original bytes
+    pos = data.find(b"0.0000")
+    while pos != -1:
+        if pos == 0 or data[pos - 1] in _VALUE_START:
+            return True
+        pos = data.find(b"0.0000", pos + 1)
+    return False
+
+
+class OrjsonBackend:
+    name = "orjson"
+
+    def loads(self, data: bytes | str) -> Any:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson is stricter (e.g. NaN, huge ints) — let stdlib decide so
+            # accepted input and error messages match the fallback backend
+            return json.loads(data)
+
+    def dumps(self, obj: Any, pretty: bool = False, sort_keys: bool = False) -> bytes:
+        option = 0
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        try:
+            data = orjson.dumps(obj, option=option)
+        except TypeError:
+            return StdlibBackend().dumps(obj, pretty=pretty, sort_keys=sort_keys)
+        if _has_nonportable_float(data):
+            return StdlibBackend().dumps(obj, pretty=pretty, sort_keys=sort_keys)
+        return data
+
+
+def available_backends() -> list:
+    backends = [StdlibBackend()]
+    if HAS_ORJSON:
+        backends.append(OrjsonBackend())
+    return backends
+
+
+def _select_backend():
+    if os.environ.get("WHIPS_JSON_BACKEND") == "json" or not HAS_ORJSON:
+        return StdlibBackend()
+    return OrjsonBackend()
+
+
+backend = _select_backend()
+
+
+def loads(data: bytes | str) -> Any:
+    return backend.loads(data)
+
+
+def dumps(obj: Any, pretty: bool = False, sort_keys: bool = False) -> bytes:
+    return backend.dumps(obj, pretty=pretty, sort_keys=sort_keys)
+
+
+def read_json(path: Path) -> Any:
+    """Read and parse a JSON file. Raises OSError or JSONDecodeError."""
+    return backend.loads(Path(path).read_bytes())
+
+
+def write_json(path: Path, obj: Any, pretty: bool = False, sort_keys: bool = False):
+    """Serialize obj to path with a trailing newline in a single write."""
+    Path(path).write_bytes(backend.dumps(obj, pretty=pretty, sort_keys=sort_keys) + b"\n")
+
+
+if __name__ == "__main__":
+    print(f"JSON backend: {backend.name} (orjson {'available' if HAS_ORJSON else 'not installed'})")
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Whips Spatial Index
+Builds a 2D k-d tree over a level's interactable placements.
+
+The tree is stored implicitly as a flat list: for any range [lo, hi) the
+node at (lo + hi) // 2 is the root of that subtree, split on axis
+depth % 2 (0 = x, 1 = y). The same layout is written to
+resources/generated/spatial/ and walked by ContentLoader.gd at runtime,
+so nearest and in-radius queries cost O(log n) instead of a full scan.
+
+Usage:
+    python spatial_index.py <level.json>    # print the index for a level
+"""
+
+import sys
+from pathlib import Path
+from typing import Any
+
+from json_backend import dumps, read_json
+
+INDEX_FORMAT = "kdtree_2d"
+
+
+def _position(entry: dict) -> tuple[float, float] | None:
+    pos = entry.get("position")
+    if not isinstance(pos, list) or len(pos) < 2:
+        return None
+    try:
+        return float(pos[0]), float(pos[1])
+    except (TypeError, ValueError):
+        return None
+
+
+def build_kdtree(interactables: list[dict]) -> list[dict]:
+    """Return placed interactables reordered into an implicit k-d tree.
+
+    Entries without a usable 2-element position are left out.
+    """
+    nodes = []
+    for item in interactables:
+        pos = _position(item)
+        if pos is None:
+            continue
+        nodes.append({"id": item.get("id", ""), "type": item.get("type", ""), "position": [pos[0], pos[1]]})
+
+    def _build(lo: int, hi: int, depth: int):
+        if hi - lo <= 1:
+            return
+        axis = depth % 2
+        # Sort on (axis, other axis, id) so the layout is deterministic
+        nodes[lo:hi] = sorted(
+            nodes[lo:hi],
+            key=lambda n: (n["position"][axis], n["position"][1 - axis], str(n["id"])),
+        )
+        mid = (lo + hi) // 2
+        _build(lo, mid, depth + 1)
+        _build(mid + 1, hi, depth + 1)
+
+    _build(0, len(nodes), 0)
+    return nodes
+
+
+def nearest(tree: list[dict], point: tuple[float, float], exclude_id: str | None = None) -> tuple[dict | None, float]:
+    """Find the node closest to point. Returns (node, distance) or (None, inf)."""
+    best: list[Any] = [None, float("inf")]
+
+    def _search(lo: int, hi: int, depth: int):
+        if lo >= hi:
+            return
+        mid = (lo + hi) // 2
+        node = tree[mid]
+        nx, ny = node["position"]
+        if node["id"] != exclude_id:
+            d2 = (nx - point[0]) ** 2 + (ny - point[1]) ** 2
+            if d2 < best[1]:
+                best[0], best[1] = node, d2
+        axis = depth % 2
+        delta = point[axis] - node["position"][axis]
+        near, far = ((lo, mid), (mid + 1, hi)) if delta < 0 else ((mid + 1, hi), (lo, mid))
+        _search(near[0], near[1], depth + 1)
+        if delta * delta < best[1]:
+            _search(far[0], far[1], depth + 1)
+
+    _search(0, len(tree), 0)
+    return best[0], best[1] ** 0.5
+
+
+def within_radius(tree: list[dict], point: tuple[float, float], radius: float) -> list[dict]:
+    """Return all nodes within radius of point (inclusive)."""
+    found: list[dict] = []
+    r2 = radius * radius
+
+    def _search(lo: int, hi: int, depth: int):
+        if lo >= hi:
+            return
+        mid = (lo + hi) // 2
+        node = tree[mid]
+        nx, ny = node["position"]
+        if (nx - point[0]) ** 2 + (ny - point[1]) ** 2 <= r2:
+            found.append(node)
+        axis = depth % 2
+        delta = point[axis] - node["position"][axis]
+        if delta <= radius:
+            _search(lo, mid, depth + 1)
+        if delta >= -radius:
+            _search(mid + 1, hi, depth + 1)
+
+    _search(0, len(tree), 0)
+    return found
+
+
+def build_level_index(level: dict) -> dict:
+    """Build the spatial index artifact for a single level."""
+    tree = build_kdtree(level.get("interactables", []))
+    if tree:
+        xs = [n["position"][0] for n in tree]
+        ys = [n["position"][1] for n in tree]
+        bounds = [min(xs), min(ys), max(xs), max(ys)]
+    else:
+        bounds = [0.0, 0.0, 0.0, 0.0]
+    return {
+        "level_id": level.get("level_id", ""),
+        "format": INDEX_FORMAT,
+        "bounds": bounds,
+        "nodes": tree,
+    }
+
+
+def main():
+    args = sys.argv[1:]
+    if not args:
+        print("Usage: python spatial_index.py <level.json>")
+        sys.exit(1)
+
+    level = read_json(Path(args[0]))
+    print(dumps(build_level_index(level), pretty=True).decode("utf-8"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+Whips String Table
+Extracts player-facing text from content into one deduplicated string table.
+
+Each unique string gets a stable ID derived from its text, so single-file
+rebuilds and full builds agree on IDs. Generated content replaces the
+inline text with a reference ("@str_<id>") that ContentLoader.gd resolves
+against resources/generated/strings.json at load time.
+
+Usage:
+    python string_table.py --verify     # check generated content round-trips to content/
+    python string_table.py --stats      # report duplication in content/
+"""
+
+import base64
+import hashlib
+import sys
+from pathlib import Path
+from typing import Any, Callable
+
+from json_backend import read_json, write_json
+
+CONTENT_DIR = Path(__file__).parent.parent / "content"
+OUTPUT_DIR = Path(__file__).parent.parent / "godot_project" / "resources" / "generated"
+STRING_TABLE_PATH = OUTPUT_DIR / "strings.json"
+
+STRING_REF_PREFIX = "@str_"
+STRING_TABLE_VERSION = 1
+
+# Player-facing fields per content type. "a.b" walks into objects,
+# "a[]" walks every element of a list.
+PLAYER_FACING_FIELDS = {
+    "zones": [
+        "name", "description", "guide_animal.name",
+    ],
+    "levels": [
+        "region_name", "landmark.name", "landmark.description",
+        "eco_puzzle.description", "choice_map[].description",
+    ],
+    "tasks": [
+        "prompt", "explanation", "hints[].text", "solution_approaches[].hint",
+        "on_incorrect.common_mistakes[].feedback",
+    ],
+    "reference_pages": [
+        "title", "sections[].heading", "sections[].content",
+        "sections[].examples[].problem", "sections[].examples[].solution",
+        "sections[].examples[].steps[]",
+        "common_pitfalls[].mistake", "common_pitfalls[].correction",
+    ],
+    "dialogues": [
+        "speaker.name", "nodes[].text", "nodes[].choices[].text",
+    ],
+}
+
+
+def string_id(text: str) -> str:
+    """Stable ID for a piece of text (48 bits of SHA-1, URL-safe base64)."""
+    digest = hashlib.sha1(text.encode("utf-8")).digest()
+    return "str_" + base64.urlsafe_b64encode(digest[:6]).decode("ascii")
+
+
+def _rewrite_path(node: Any, parts: list[str], fn: Callable[[str], str]) -> Any:
+    """Apply fn to every string found at parts inside node (in place)."""
+    if not parts:
+        return fn(node) if isinstance(node, str) else node
+
+    head, rest = parts[0], parts[1:]
+    is_list = head.endswith("[]")
+    key = head[:-2] if is_list else head
+
+    if key:
+        if not isinstance(node, dict) or key not in node:
+            return node
+        target = node[key]
+    else:
+        target = node
+
+    if is_list:
+        if isinstance(target, list):
+            for i, item in enumerate(target):
+                target[i] = _rewrite_path(item, rest, fn)
+        new_value = target
+    else:
+        new_value = _rewrite_path(target, rest, fn)
+
+    if key:
+        node[key] = new_value
+        return node
+    return new_value
+
+
+def _split_path(path: str) -> list[str]:
+    # "sections[].examples[].steps[]" -> ["sections[]", "examples[]", "steps[]"]
+    return [p for p in path.replace("[]", "[].").split(".") if p]
+
+
+def _items(data: Any) -> list:
+    return data if isinstance(data, list) else [data]
+
+
+def extract_strings(data: Any, content_type: str, table: dict[str, str]) -> Any:
+    """Replace player-facing strings in data with references, filling table.
+
+    data is modified in place and returned. Raises ValueError if content
+    already contains text that looks like a string reference.
+    """
+    def _extract(text: str) -> str:
+        if text.startswith(STRING_REF_PREFIX):
+            raise ValueError(f"Content text may not start with '{STRING_REF_PREFIX}': {text!r}")
+        sid = string_id(text)
+        existing = table.get(sid)
+        if existing is not None and existing != text:
+            raise ValueError(f"String ID collision for {sid}")
+        table[sid] = text
+        return "@" + sid
+
+    paths = PLAYER_FACING_FIELDS.get(content_type, [])
+    for item in _items(data):
+        for path in paths:
+            _rewrite_path(item, _split_path(path), _extract)
+    return data
+
+
+def resolve_strings(data: Any, table: dict[str, str]) -> Any:
+    """Return a copy of data with every string reference replaced by its text."""
+    if isinstance(data, dict):
+        return {k: resolve_strings(v, table) for k, v in data.items()}
+    if isinstance(data, list):
+        return [resolve_strings(v, table) for v in data]
+    if isinstance(data, str) and data.startswith(STRING_REF_PREFIX):
+        sid = data[1:]
+        if sid not in table:
+            raise KeyError(f"Unknown string reference {data}")
+        return table[sid]
+    return data
+
+
+def load_string_table(path: Path = STRING_TABLE_PATH) -> dict[str, str]:
+    if not path.exists():
+        return {}
+    return read_json(path).get("strings", {})
+
+
+def write_string_table(table: dict[str, str], path: Path = STRING_TABLE_PATH):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    write_json(path, {"version": STRING_TABLE_VERSION, "strings": dict(sorted(table.items()))})
+
+
+class ExtractionStats:
+    """Counts how much inline text the string table deduplicates."""
+
+    def __init__(self):
+        self.total_strings = 0
+        self.total_bytes = 0
+        self.unique: dict[str, int] = {}
+
+    def add(self, text: str):
+        size = len(text.encode("utf-8"))
+        self.total_strings += 1
+        self.total_bytes += size
+        self.unique[text] = size
+
+    @property
+    def unique_bytes(self) -> int:
+        return sum(self.unique.values())
+
+    def summary(self) -> str:
+        return (f"Strings: {self.total_strings} inline, {len(self.unique)} unique "
+                f"({self.total_strings - len(self.unique)} duplicates); "
+                f"text bytes {self.total_bytes} -> {self.unique_bytes}")
+
+
+def collect_stats(data: Any, content_type: str, stats: ExtractionStats):
+    """Record every player-facing string in data without modifying it."""
+    def _record(text: str) -> str:
+        stats.add(text)
+        return text
+
+    paths = PLAYER_FACING_FIELDS.get(content_type, [])
+    for item in _items(data):
+        for path in paths:
+            _rewrite_path(item, _split_path(path), _record)
+
+
+def verify_round_trip(content_dir: Path = CONTENT_DIR, output_dir: Path = OUTPUT_DIR) -> list[str]:
+    """Check that every generated file resolves back to its source. Returns problems."""
+    problems = []
+    table = load_string_table(output_dir / "strings.json")
+    for content_type in PLAYER_FACING_FIELDS:
+        src_dir = content_dir / content_type
+        if not src_dir.exists():
+            continue
+        for src in sorted(src_dir.glob("*.json")):
+            out = output_dir / content_type / src.name
+            if not out.exists():
+                problems.append(f"{content_type}/{src.name}: not built")
+                continue
+            original = read_json(src)
+            generated = read_json(out)
+            try:
+                resolved = resolve_strings(generated, table)
+            except KeyError as e:
+                problems.append(f"{content_type}/{src.name}: {e.args[0]}")
+                continue
+            if resolved != original:
+                problems.append(f"{content_type}/{src.name}: resolved content differs from source")
+    return problems
+
+
+def main():
+    args = sys.argv[1:]
+
+    if "--stats" in args:
+        stats = ExtractionStats()
+        for content_type in PLAYER_FACING_FIELDS:
+            for f in sorted((CONTENT_DIR / content_type).glob("*.json")):
+                collect_stats(read_json(f), content_type, stats)
+        print(stats.summary())
+        return
+
+    if "--verify" in args:
+        problems = verify_round_trip()
+        for p in problems:
+            print(f"  ERROR: {p}")
+        if problems:
+            sys.exit(1)
+        print("String table round trip OK")
+        return
+
+    print("Usage: python string_table.py [--verify | --stats]")
+    sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()